@@ -0,0 +1,104 @@
+"""Micro-batching coalescer for single-text embedding requests."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class EmbeddingBatcher:
+    """Coalesce concurrent single-text embed calls into one batch API call.
+
+    Single-text requests arriving within the batching window are collected
+    and flushed as one embeddings API call, then each caller's future is
+    resolved with its own vector. For bursty traffic this cuts API calls
+    substantially while bounding added latency by the window size.
+    """
+
+    def __init__(
+        self,
+        embed_batch: Callable[[list[str]], Awaitable[list[list[float]]]],
+        window_ms: float = 8.0,
+        max_batch: int = 64,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            embed_batch: Coroutine generating embeddings for a list of texts,
+                returning vectors in input order
+            window_ms: How long to wait for more requests before flushing
+            max_batch: Flush immediately once this many requests are pending
+        """
+        self._embed_batch = embed_batch
+        self._window_seconds = window_ms / 1000.0
+        self._max_batch = max_batch
+        self._pending: list[tuple[str, asyncio.Future[list[float]]]] = []
+        self._flush_handle: asyncio.Task[None] | None = None
+        # The loop holds only weak refs to tasks; keep flushes alive here
+        # so GC can't drop one mid-flight and strand the waiting futures
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+        self._log = logger.bind(component="embedding_batcher")
+
+    async def submit(self, text: str) -> list[float]:
+        """Queue a text for the next batch and wait for its embedding.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector for the text
+        """
+        future: asyncio.Future[list[float]] = asyncio.get_running_loop().create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self._max_batch:
+            self._flush_now()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.create_task(self._flush_after_window())
+
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        """Wait out the batching window, then flush pending requests."""
+        await asyncio.sleep(self._window_seconds)
+        self._flush_handle = None
+        await self._flush(self._take_pending())
+
+    def _flush_now(self) -> None:
+        """Flush the pending batch immediately (max batch size reached)."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        task = asyncio.create_task(self._flush(self._take_pending()))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    def _take_pending(self) -> list[tuple[str, asyncio.Future[list[float]]]]:
+        """Detach and return the current pending batch."""
+        batch = self._pending
+        self._pending = []
+        return batch
+
+    async def _flush(
+        self,
+        batch: list[tuple[str, asyncio.Future[list[float]]]],
+    ) -> None:
+        """Embed a batch and resolve each caller's future."""
+        if not batch:
+            return
+
+        self._log.debug("flushing_batch", size=len(batch))
+
+        try:
+            embeddings = await self._embed_batch([text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), embedding in zip(batch, embeddings, strict=True):
+            if not future.done():
+                future.set_result(embedding)
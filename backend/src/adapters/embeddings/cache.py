@@ -0,0 +1,193 @@
+"""Two-tier embedding cache: in-process LRU plus optional SQLite store."""
+
+import asyncio
+import difflib
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class EmbeddingCache:
+    """Cache for embedding vectors keyed by model and input text.
+
+    Lookups check an in-process LRU first (microseconds), then an optional
+    SQLite backing store so cached embeddings survive process restarts.
+    Entries are keyed by sha256(model + "\\0" + text) and expire after the
+    configured TTL. SQLite reads and writes run in worker threads so the
+    disk tier never blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        capacity: int = 10_000,
+        ttl_seconds: float | None = None,
+        db_path: str | None = None,
+        fuzzy: bool = False,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            model: Embedding model name (part of the cache key)
+            capacity: Maximum number of entries in the in-process LRU
+            ttl_seconds: Entry lifetime in seconds (None = no expiry)
+            db_path: Path to SQLite backing store (None = memory only)
+            fuzzy: Enable near-duplicate lookups over recent texts
+        """
+        self._model = model
+        self._capacity = capacity
+        self._ttl_seconds = ttl_seconds
+        self._lru: OrderedDict[bytes, tuple[list[float], float | None]] = OrderedDict()
+        self._fuzzy = fuzzy
+        self._recent: deque[tuple[str, list[float]]] = deque(maxlen=1024)
+        self._log = logger.bind(cache="embedding", model=model)
+
+        self._db: sqlite3.Connection | None = None
+        # DB calls run via asyncio.to_thread, so the connection is shared
+        # across worker threads and serialized with a lock
+        self._db_lock = threading.Lock()
+        if db_path is not None:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key BLOB PRIMARY KEY, "
+                "model TEXT NOT NULL, "
+                "embedding TEXT NOT NULL, "
+                "expires_at REAL)"
+            )
+            self._db.commit()
+
+    async def get(self, text: str) -> list[float] | None:
+        """Look up a cached embedding for the given text.
+
+        Args:
+            text: Input text the embedding was generated for
+
+        Returns:
+            Cached embedding vector, or None on miss/expiry
+        """
+        key = self._key(text)
+        now = time.time()
+
+        entry = self._lru.get(key)
+        if entry is not None:
+            embedding, expires_at = entry
+            if expires_at is None or expires_at > now:
+                self._lru.move_to_end(key)
+                return embedding
+            del self._lru[key]
+
+        if self._db is None:
+            return None
+
+        row = await asyncio.to_thread(self._db_get, key, now)
+        if row is not None:
+            embedding, expires_at = row
+            self._insert_lru(key, embedding, expires_at)
+            return embedding
+
+        return None
+
+    def get_fuzzy(self, text: str) -> list[float] | None:
+        """Look up an embedding for a near-duplicate of the given text.
+
+        Trivial edits (trailing whitespace, typo fixes) change the hash key
+        but barely change the embedding, so recently embedded texts within
+        ~5% edit distance are treated as hits. Only consulted when fuzzy
+        lookups are enabled.
+
+        Args:
+            text: Input text to match against recently embedded texts
+
+        Returns:
+            Embedding of a near-duplicate text, or None
+        """
+        if not self._fuzzy:
+            return None
+
+        for candidate, embedding in self._recent:
+            # Cheap length prefilter before computing the ratio
+            max_len = max(len(text), len(candidate))
+            if max_len == 0 or abs(len(text) - len(candidate)) / max_len >= 0.05:
+                continue
+            if difflib.SequenceMatcher(None, text, candidate).ratio() >= 0.95:
+                self._log.debug("fuzzy_cache_hit", text_length=len(text))
+                return embedding
+
+        return None
+
+    async def put(self, text: str, embedding: list[float]) -> None:
+        """Store an embedding for the given text.
+
+        Args:
+            text: Input text the embedding was generated for
+            embedding: Embedding vector to cache
+        """
+        key = self._key(text)
+        expires_at = time.time() + self._ttl_seconds if self._ttl_seconds else None
+
+        self._insert_lru(key, embedding, expires_at)
+
+        if self._fuzzy:
+            self._recent.append((text, embedding))
+
+        if self._db is not None:
+            await asyncio.to_thread(self._db_put, key, embedding, expires_at)
+
+    def _key(self, text: str) -> bytes:
+        """Compute the cache key for a text."""
+        return hashlib.sha256(f"{self._model}\0{text}".encode()).digest()
+
+    def _db_get(
+        self,
+        key: bytes,
+        now: float,
+    ) -> tuple[list[float], float | None] | None:
+        """Read one entry from the SQLite tier (runs in a worker thread)."""
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT embedding, expires_at FROM embeddings WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            embedding_json, expires_at = row
+            if expires_at is None or expires_at > now:
+                return json.loads(embedding_json), expires_at
+            self._db.execute("DELETE FROM embeddings WHERE key = ?", (key,))
+            self._db.commit()
+            return None
+
+    def _db_put(
+        self,
+        key: bytes,
+        embedding: list[float],
+        expires_at: float | None,
+    ) -> None:
+        """Write one entry to the SQLite tier (runs in a worker thread)."""
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO embeddings (key, model, embedding, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, self._model, json.dumps(embedding), expires_at),
+            )
+            self._db.commit()
+
+    def _insert_lru(
+        self,
+        key: bytes,
+        embedding: list[float],
+        expires_at: float | None,
+    ) -> None:
+        """Insert into the LRU, evicting the oldest entry if at capacity."""
+        self._lru[key] = (embedding, expires_at)
+        self._lru.move_to_end(key)
+        if len(self._lru) > self._capacity:
+            self._lru.popitem(last=False)
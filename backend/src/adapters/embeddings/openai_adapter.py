@@ -1,29 +1,80 @@
 """OpenAI embedding adapter implementing EmbeddingProviderPort."""
 
+import time
+from functools import lru_cache
+
 import structlog
 from openai import AsyncOpenAI
 
+from src.adapters.embeddings.batcher import EmbeddingBatcher
+from src.adapters.embeddings.cache import EmbeddingCache
 from src.domain.ports.embedding_provider import EmbeddingProviderPort
 
 logger = structlog.get_logger()
 
 
+@lru_cache(maxsize=4)
+def _get_shared_client(api_key: str) -> AsyncOpenAI:
+    """Get a process-wide AsyncOpenAI client for the given API key.
+
+    Each AsyncOpenAI instance owns its own httpx connection pool, so
+    sharing one per key preserves keep-alive connections and TLS session
+    reuse across adapter instances. Pooled clients live for the process
+    lifetime.
+    """
+    return AsyncOpenAI(api_key=api_key)
+
+
 class OpenAIEmbeddingAdapter(EmbeddingProviderPort):
     """OpenAI embedding provider using text-embedding-3-small model.
 
     Implements EmbeddingProviderPort for generating 1536-dimensional embeddings.
+    Results are cached (in-process LRU plus optional SQLite store) so repeated
+    texts skip the API round trip entirely.
     """
 
     MODEL = "text-embedding-3-small"
     DIMENSIONS = 1536
 
-    def __init__(self, api_key: str) -> None:
+    # Liveness probes can fire every few seconds; a recent success is
+    # reused for this long instead of re-querying OpenAI
+    HEALTH_CACHE_TTL = 10.0
+
+    def __init__(
+        self,
+        api_key: str,
+        cache_capacity: int = 10_000,
+        cache_ttl_seconds: float | None = None,
+        cache_path: str | None = None,
+        fuzzy_cache: bool = False,
+        batch_window_ms: float = 8.0,
+        batch_max: int = 64,
+    ) -> None:
         """Initialize the OpenAI client.
 
         Args:
             api_key: OpenAI API key
+            cache_capacity: Maximum entries in the in-process embedding cache
+            cache_ttl_seconds: Cache entry lifetime (None = no expiry)
+            cache_path: SQLite file backing the cache (None = memory only)
+            fuzzy_cache: Reuse embeddings for near-duplicate texts
+            batch_window_ms: Coalescing window for concurrent embed_text calls
+            batch_max: Flush the coalescing batch once it reaches this size
         """
-        self._client = AsyncOpenAI(api_key=api_key)
+        self._client = _get_shared_client(api_key)
+        self._cache = EmbeddingCache(
+            model=self.MODEL,
+            capacity=cache_capacity,
+            ttl_seconds=cache_ttl_seconds,
+            db_path=cache_path,
+            fuzzy=fuzzy_cache,
+        )
+        self._batcher = EmbeddingBatcher(
+            embed_batch=self._embed_batch,
+            window_ms=batch_window_ms,
+            max_batch=batch_max,
+        )
+        self._last_healthy_at: float | None = None
         self._log = logger.bind(adapter="openai_embedding")
 
     async def embed_text(self, text: str) -> list[float]:
@@ -35,14 +86,23 @@ class OpenAIEmbeddingAdapter(EmbeddingProviderPort):
         Returns:
             1536-dimensional embedding vector
         """
-        self._log.debug("embedding_single_text", text_length=len(text))
+        cached = await self._cache.get(text)
+        if cached is not None:
+            self._log.debug("embedding_cache_hit", text_length=len(text))
+            return cached
+
+        # Interactive path only: near-duplicate texts (typo fixes, trailing
+        # whitespace) reuse a recent embedding instead of a new API call
+        fuzzy = self._cache.get_fuzzy(text)
+        if fuzzy is not None:
+            await self._cache.put(text, fuzzy)
+            return fuzzy
 
-        response = await self._client.embeddings.create(
-            model=self.MODEL,
-            input=text,
-        )
+        self._log.debug("embedding_single_text", text_length=len(text))
 
-        embedding = response.data[0].embedding
+        # Concurrent single-text calls are coalesced into one API request
+        embedding = await self._batcher.submit(text)
+        await self._cache.put(text, embedding)
         self._log.debug("embedding_complete", dimensions=len(embedding))
 
         return embedding
@@ -59,20 +119,64 @@ class OpenAIEmbeddingAdapter(EmbeddingProviderPort):
         if not texts:
             return []
 
-        self._log.debug("embedding_batch", count=len(texts))
+        # Partition into cache hits and misses, keeping original positions
+        embeddings: list[list[float] | None] = [None] * len(texts)
+        miss_indices: list[int] = []
+        for i, text in enumerate(texts):
+            cached = await self._cache.get(text)
+            if cached is not None:
+                embeddings[i] = cached
+            else:
+                miss_indices.append(i)
+
+        self._log.debug(
+            "embedding_batch",
+            count=len(texts),
+            cache_hits=len(texts) - len(miss_indices),
+        )
+
+        if miss_indices:
+            fetched = await self._embed_batch([texts[i] for i in miss_indices])
+            for i, embedding in zip(miss_indices, fetched, strict=True):
+                embeddings[i] = embedding
+                await self._cache.put(texts[i], embedding)
+
+        self._log.debug("batch_embedding_complete", count=len(embeddings))
+
+        return [e for e in embeddings if e is not None]
+
+    async def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Call the embeddings API for a batch of texts.
+
+        Args:
+            texts: Texts to embed
 
+        Returns:
+            Embedding vectors in input order
+        """
         response = await self._client.embeddings.create(
             model=self.MODEL,
             input=texts,
         )
 
-        # Sort by index to maintain order
-        sorted_data = sorted(response.data, key=lambda x: x.index)
-        embeddings = [item.embedding for item in sorted_data]
-
-        self._log.debug("batch_embedding_complete", count=len(embeddings))
-
-        return embeddings
+        data = response.data
+
+        # The API returns batches in input order in practice; take the flat
+        # comprehension when that holds and only reorder when it doesn't
+        if all(i == item.index for i, item in enumerate(data)):
+            return [item.embedding for item in data]
+
+        # Out-of-order response: scatter into a preallocated list in O(n),
+        # then fail loudly if the API left any input without an embedding
+        # rather than handing an empty vector downstream
+        ordered: list[list[float] | None] = [None] * len(texts)
+        for item in data:
+            ordered[item.index] = item.embedding
+        if any(embedding is None for embedding in ordered):
+            raise ValueError(
+                f"embeddings response covered {len(data)} of {len(texts)} inputs"
+            )
+        return [embedding for embedding in ordered if embedding is not None]
 
     def get_dimensions(self) -> int:
         """Get the dimensionality of embeddings.
@@ -88,17 +192,25 @@ class OpenAIEmbeddingAdapter(EmbeddingProviderPort):
         Returns:
             Health status with model and connectivity info
         """
+        healthy = {
+            "status": "healthy",
+            "model": self.MODEL,
+            "dimensions": self.DIMENSIONS,
+        }
+
+        now = time.monotonic()
+        if (
+            self._last_healthy_at is not None
+            and now - self._last_healthy_at < self.HEALTH_CACHE_TTL
+        ):
+            return healthy
+
         try:
-            # Simple embedding to verify connectivity
-            await self._client.embeddings.create(
-                model=self.MODEL,
-                input="health check",
-            )
-            return {
-                "status": "healthy",
-                "model": self.MODEL,
-                "dimensions": self.DIMENSIONS,
-            }
+            # Metadata fetch verifies reachability and key validity without
+            # paying for (and waiting on) an actual embedding
+            await self._client.models.retrieve(self.MODEL)
+            self._last_healthy_at = now
+            return healthy
         except Exception as e:
             self._log.error("health_check_failed", error=str(e))
             return {
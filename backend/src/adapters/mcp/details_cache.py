@@ -0,0 +1,60 @@
+"""TTL cache for prefetched gift details."""
+
+import time
+from collections import OrderedDict
+
+from src.domain.entities.gift import Gift
+
+
+class GiftDetailsCache:
+    """LRU cache with TTL for Gift entities keyed by gift ID.
+
+    Populated speculatively after a get_recommendations response: the
+    client almost always follows up with get_gift_details for one of the
+    returned IDs, so prefetching the top results hides that lookup's
+    latency behind work that already completed.
+    """
+
+    def __init__(self, capacity: int = 256, ttl_seconds: float = 300.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            capacity: Maximum number of cached gifts (LRU eviction)
+            ttl_seconds: Entry lifetime in seconds
+        """
+        self._capacity = capacity
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[Gift, float]] = OrderedDict()
+
+    def get(self, gift_id: str) -> Gift | None:
+        """Look up a cached gift by ID.
+
+        Args:
+            gift_id: UUID of the gift
+
+        Returns:
+            Cached Gift, or None on miss/expiry
+        """
+        entry = self._entries.get(gift_id)
+        if entry is None:
+            return None
+
+        gift, cached_at = entry
+        if time.time() - cached_at > self._ttl_seconds:
+            del self._entries[gift_id]
+            return None
+
+        self._entries.move_to_end(gift_id)
+        return gift
+
+    def put(self, gift_id: str, gift: Gift) -> None:
+        """Store a gift, evicting the least recently used entry if full.
+
+        Args:
+            gift_id: UUID of the gift
+            gift: Gift entity to cache
+        """
+        self._entries[gift_id] = (gift, time.time())
+        self._entries.move_to_end(gift_id)
+        if len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
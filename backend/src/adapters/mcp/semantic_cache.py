@@ -0,0 +1,119 @@
+"""Semantic response cache for MCP tool handlers."""
+
+import time
+from typing import Any
+
+import numpy as np
+import structlog
+
+logger = structlog.get_logger()
+
+
+class SemanticResponseCache:
+    """Cache tool responses keyed by query-embedding similarity.
+
+    Near-duplicate queries (typos, re-asks, paraphrases) produce embeddings
+    that are nearly parallel. Lookups compute cosine similarity between the
+    query embedding and all cached centroids in a single matrix-vector
+    product; if the best match clears the threshold and its request options
+    match exactly, the stored response is returned without re-running the
+    embed + vector-search pipeline.
+
+    Caches are namespaced per tool so responses never leak across tools.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        threshold: float = 0.86,
+        capacity: int = 512,
+        ttl_seconds: float = 300.0,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            namespace: Tool name this cache serves (for logging/isolation)
+            threshold: Minimum cosine similarity for a hit (0.0-1.0)
+            capacity: Maximum number of cached responses (FIFO eviction)
+            ttl_seconds: Response lifetime in seconds
+        """
+        self._namespace = namespace
+        self._threshold = threshold
+        self._capacity = capacity
+        self._ttl_seconds = ttl_seconds
+        self._centroids = np.empty((0, 0), dtype=np.float32)
+        self._entries: list[tuple[tuple[Any, ...], dict[str, Any], float]] = []
+        self._log = logger.bind(cache="semantic_response", namespace=namespace)
+
+    def lookup(
+        self,
+        embedding: list[float],
+        options: tuple[Any, ...] = (),
+    ) -> dict[str, Any] | None:
+        """Find a cached response for a semantically similar query.
+
+        Args:
+            embedding: Query embedding
+            options: Request options that must match exactly (e.g. limit)
+
+        Returns:
+            Cached response dict, or None on miss
+        """
+        if not self._entries:
+            return None
+
+        query = self._normalize(embedding)
+        scores = self._centroids @ query
+        best = int(np.argmax(scores))
+        best_score = float(scores[best])
+
+        if best_score < self._threshold:
+            return None
+
+        cached_options, response, cached_at = self._entries[best]
+        if cached_options != options:
+            return None
+        if time.time() - cached_at > self._ttl_seconds:
+            self._evict(best)
+            return None
+
+        self._log.debug("semantic_cache_hit", similarity=best_score)
+        return response
+
+    def store(
+        self,
+        embedding: list[float],
+        response: dict[str, Any],
+        options: tuple[Any, ...] = (),
+    ) -> None:
+        """Cache a response under the query's embedding centroid.
+
+        Args:
+            embedding: Query embedding
+            response: Response dict to cache
+            options: Request options required for future hits
+        """
+        centroid = self._normalize(embedding).reshape(1, -1)
+
+        if self._centroids.size == 0:
+            self._centroids = centroid
+        else:
+            self._centroids = np.vstack([self._centroids, centroid])
+        self._entries.append((options, response, time.time()))
+
+        if len(self._entries) > self._capacity:
+            self._evict(0)
+
+    def _evict(self, index: int) -> None:
+        """Remove the entry (and its centroid row) at the given index."""
+        self._centroids = np.delete(self._centroids, index, axis=0)
+        del self._entries[index]
+
+    @staticmethod
+    def _normalize(embedding: list[float]) -> np.ndarray:
+        """Convert to an L2-normalized float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm > 0.0:
+            vector = vector / norm
+        return vector
@@ -1,11 +1,17 @@
 """FastMCP server setup for gift recommendations."""
 
+import inspect
+from dataclasses import dataclass
+from functools import partial
 from typing import Annotated
 
 import structlog
 from fastmcp import FastMCP
+from fastmcp.tools import Tool
 from mcp.types import ToolAnnotations
 
+from src.adapters.mcp.details_cache import GiftDetailsCache
+from src.adapters.mcp.semantic_cache import SemanticResponseCache
 from src.adapters.mcp.tools.get_gift_details import get_gift_details_handler
 from src.adapters.mcp.tools.get_recommendations import get_recommendations_handler
 from src.config.settings import Settings
@@ -14,9 +20,89 @@ from src.domain.services.recommendation_service import RecommendationService
 
 logger = structlog.get_logger()
 
-# Global service instances (set during server creation)
-_recommendation_service: RecommendationService | None = None
-_vector_store: VectorStorePort | None = None
+# Shared by every tool registration; constructed once at import
+_READ_ONLY = ToolAnnotations(readOnlyHint=True)
+
+@dataclass(frozen=True, slots=True)
+class ToolContext:
+    """Dependencies bound to the registered tools.
+
+    Bundled into one frozen object so tool invocations receive their
+    services as a bound argument rather than through mutable module
+    globals.
+    """
+
+    service: RecommendationService
+    vector_store: VectorStorePort | None
+    semantic_cache: SemanticResponseCache
+    details_cache: GiftDetailsCache
+
+
+async def _get_recommendations_tool(
+    ctx: ToolContext,
+    keywords: Annotated[
+        str,
+        "Search keywords for finding gifts. Include recipient interests, occasion, or gift type. Examples: 'coffee lover birthday', 'outdoor camping dad', 'tech gadgets christmas', 'cooking kitchen mom'",
+    ],
+    negative_keywords: Annotated[
+        str | None,
+        "Keywords to avoid in results. Use for past gifts or things to steer away from. Examples: 'coffee maker espresso' (if they already have coffee gear), 'electronics gadgets' (if you want non-tech gifts)",
+    ] = None,
+    limit: Annotated[
+        int | None,
+        "Number of recommendations to return (default: 5, min: 3, max: 10)",
+    ] = None,
+) -> dict:
+    """Search for gift recommendations using keywords.
+
+    Pass keywords about the recipient's interests, the occasion, or gift categories.
+    Use negative_keywords to avoid certain types of gifts (e.g., past gifts).
+
+    Each gift in the response includes:
+    - id: Unique identifier (use with get_gift_details to learn more)
+    - name: Gift name
+    - brief_description: Short summary
+    - price_range: budget, moderate, premium, or luxury
+    - categories: Tags like 'electronics', 'handmade', 'outdoor'
+    - relevance_score: How well it matches (0.0-1.0)
+    """
+    return await get_recommendations_handler(
+        keywords=keywords,
+        negative_keywords=negative_keywords,
+        limit=limit,
+        service=ctx.service,
+        semantic_cache=ctx.semantic_cache,
+        vector_store=ctx.vector_store,
+        details_cache=ctx.details_cache,
+    )
+
+
+async def _get_gift_details_tool(
+    ctx: ToolContext,
+    gift_id: Annotated[
+        str,
+        "The unique ID of a gift from get_recommendations results. Example: '12345678-1234-1234-1234-123456789012'",
+    ],
+) -> dict:
+    """Get full details about a specific gift idea.
+
+    Use this to learn more about a gift before recommending it. Returns the complete
+    description, suggested occasions (birthday, christmas, etc.), ideal recipient types,
+    and a purchase link when available.
+
+    The response includes:
+    - id, name, brief_description, full_description
+    - price_range: budget, moderate, premium, or luxury
+    - categories: Tags like 'electronics', 'handmade', 'outdoor'
+    - occasions: When to give it (birthday, anniversary, christmas, etc.)
+    - recipient_types: Who it's good for (tech enthusiast, home cook, etc.)
+    - purchase_url: Where to buy it (when available)
+    """
+    return await get_gift_details_handler(
+        gift_id=gift_id,
+        vector_store=ctx.vector_store,
+        details_cache=ctx.details_cache,
+    )
 
 
 def create_mcp_server(
@@ -26,6 +112,10 @@ def create_mcp_server(
 ) -> FastMCP:
     """Create and configure the FastMCP server.
 
+    Tool bodies live at module level and are bound to their services with
+    functools.partial, so registration introspects each schema once and
+    invocations avoid module-global lookups.
+
     Args:
         settings: Application settings
         recommendation_service: The recommendation service instance
@@ -34,79 +124,49 @@ def create_mcp_server(
     Returns:
         Configured FastMCP server instance
     """
-    global _recommendation_service, _vector_store
-    _recommendation_service = recommendation_service
-    _vector_store = vector_store
-
     mcp = FastMCP(
         name=settings.mcp_server_name,
         version="0.1.0",
     )
 
-    # Register the get_recommendations tool
-    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
-    async def get_recommendations(
-        keywords: Annotated[
-            str,
-            "Search keywords for finding gifts. Include recipient interests, occasion, or gift type. Examples: 'coffee lover birthday', 'outdoor camping dad', 'tech gadgets christmas', 'cooking kitchen mom'",
-        ],
-        negative_keywords: Annotated[
-            str | None,
-            "Keywords to avoid in results. Use for past gifts or things to steer away from. Examples: 'coffee maker espresso' (if they already have coffee gear), 'electronics gadgets' (if you want non-tech gifts)",
-        ] = None,
-        limit: Annotated[
-            int | None,
-            "Number of recommendations to return (default: 5, min: 3, max: 10)",
-        ] = None,
-    ) -> dict:
-        """Search for gift recommendations using keywords.
-
-        Pass keywords about the recipient's interests, the occasion, or gift categories.
-        Use negative_keywords to avoid certain types of gifts (e.g., past gifts).
-
-        Each gift in the response includes:
-        - id: Unique identifier (use with get_gift_details to learn more)
-        - name: Gift name
-        - brief_description: Short summary
-        - price_range: budget, moderate, premium, or luxury
-        - categories: Tags like 'electronics', 'handmade', 'outdoor'
-        - relevance_score: How well it matches (0.0-1.0)
-        """
-        return await get_recommendations_handler(
-            keywords=keywords,
-            negative_keywords=negative_keywords,
-            limit=limit,
-            service=_recommendation_service,
+    # Semantic cache for near-duplicate queries (namespaced per tool)
+    recommendations_cache = SemanticResponseCache(
+        namespace="get_recommendations",
+        threshold=settings.semantic_cache_threshold,
+        capacity=settings.semantic_cache_capacity,
+        ttl_seconds=settings.semantic_cache_ttl,
+    )
+
+    # Details prefetched after a recommendations response land here, so the
+    # follow-up get_gift_details call usually skips the vector store.
+    details_cache = GiftDetailsCache()
+
+    ctx = ToolContext(
+        service=recommendation_service,
+        vector_store=vector_store,
+        semantic_cache=recommendations_cache,
+        details_cache=details_cache,
+    )
+
+    mcp.add_tool(
+        Tool.from_function(
+            partial(_get_recommendations_tool, ctx),
+            name="get_recommendations",
+            description=inspect.getdoc(_get_recommendations_tool),
+            annotations=_READ_ONLY,
         )
+    )
 
     # Register the get_gift_details tool (only if vector_store provided)
-    if _vector_store is not None:
-        @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
-        async def get_gift_details(
-            gift_id: Annotated[
-                str,
-                "The unique ID of a gift from get_recommendations results. Example: '12345678-1234-1234-1234-123456789012'",
-            ],
-        ) -> dict:
-            """Get full details about a specific gift idea.
-
-            Use this to learn more about a gift before recommending it. Returns the complete
-            description, suggested occasions (birthday, christmas, etc.), ideal recipient types,
-            and a purchase link when available.
-
-            The response includes:
-            - id, name, brief_description, full_description
-            - price_range: budget, moderate, premium, or luxury
-            - categories: Tags like 'electronics', 'handmade', 'outdoor'
-            - occasions: When to give it (birthday, anniversary, christmas, etc.)
-            - recipient_types: Who it's good for (tech enthusiast, home cook, etc.)
-            - purchase_url: Where to buy it (when available)
-            """
-            return await get_gift_details_handler(
-                gift_id=gift_id,
-                vector_store=_vector_store,
+    if vector_store is not None:
+        mcp.add_tool(
+            Tool.from_function(
+                partial(_get_gift_details_tool, ctx),
+                name="get_gift_details",
+                description=inspect.getdoc(_get_gift_details_tool),
+                annotations=_READ_ONLY,
             )
-
+        )
         tools = ["get_recommendations", "get_gift_details"]
     else:
         tools = ["get_recommendations"]
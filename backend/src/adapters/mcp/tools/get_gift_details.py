@@ -1,7 +1,9 @@
 """MCP tool handler for getting gift details."""
 
+from collections import OrderedDict
 from typing import Any
 
+from src.adapters.mcp.details_cache import GiftDetailsCache
 from src.domain.entities.gift import Gift
 from src.domain.entities.gift_details import GiftDetails
 from src.domain.ports.vector_store import VectorStorePort
@@ -13,7 +15,7 @@ def _gift_to_details(gift: Gift) -> GiftDetails:
     Note: has_affiliate_commission is not included - it's for internal use only.
     """
     return GiftDetails(
-        id=str(gift.id),
+        id=gift.id_str,
         name=gift.name,
         brief_description=gift.brief_description,
         full_description=gift.full_description,
@@ -25,43 +27,92 @@ def _gift_to_details(gift: Gift) -> GiftDetails:
     )
 
 
-def _format_human_readable(details: GiftDetails) -> str:
-    """Format gift details as human-readable text."""
-    lines = [
-        f"**{details.name}**",
-        "",
-        details.full_description,
-        "",
-        f"**Price:** {details.price_range.value}",
-        f"**Categories:** {', '.join(details.categories)}",
-    ]
-
-    if details.occasions:
-        lines.append(f"**Great for:** {', '.join(details.occasions)}")
+# Memoized formatter output keyed by gift ID. Gift records change rarely
+# while the same ID is re-queried often (LLM loops, UI refreshes); entries
+# are validated against the current details so a changed gift re-renders.
+_format_cache: OrderedDict[str, tuple[GiftDetails, str]] = OrderedDict()
+_FORMAT_CACHE_MAX = 4096
 
-    if details.recipient_types:
-        lines.append(f"**Perfect for:** {', '.join(details.recipient_types)}")
 
-    if details.purchase_url:
-        lines.append(f"**Where to buy:** {details.purchase_url}")
-
-    return "\n".join(lines)
+def _format_human_readable(details: GiftDetails) -> str:
+    """Format gift details as human-readable text (memoized per gift)."""
+    cached = _format_cache.get(details.id)
+    if cached is not None and cached[0] == details:
+        _format_cache.move_to_end(details.id)
+        return cached[1]
+
+    text = _render_human_readable(details)
+
+    _format_cache[details.id] = (details, text)
+    _format_cache.move_to_end(details.id)
+    if len(_format_cache) > _FORMAT_CACHE_MAX:
+        _format_cache.popitem(last=False)
+
+    return text
+
+
+# Precompiled details template; optional sections render as empty strings
+_DETAILS_TEMPLATE = (
+    "**{name}**\n"
+    "\n"
+    "{description}\n"
+    "\n"
+    "**Price:** {price}\n"
+    "**Categories:** {categories}{occasions}{recipients}{purchase}"
+)
+
+
+def _render_human_readable(details: GiftDetails) -> str:
+    """Build the human-readable text for gift details."""
+    return _DETAILS_TEMPLATE.format_map(
+        {
+            "name": details.name,
+            "description": details.full_description,
+            "price": details.price_range.value,
+            "categories": ", ".join(details.categories),
+            "occasions": (
+                f"\n**Great for:** {', '.join(details.occasions)}"
+                if details.occasions
+                else ""
+            ),
+            "recipients": (
+                f"\n**Perfect for:** {', '.join(details.recipient_types)}"
+                if details.recipient_types
+                else ""
+            ),
+            "purchase": (
+                f"\n**Where to buy:** {details.purchase_url}"
+                if details.purchase_url
+                else ""
+            ),
+        }
+    )
 
 
 async def get_gift_details_handler(
     gift_id: str,
     vector_store: VectorStorePort,
+    details_cache: GiftDetailsCache | None = None,
 ) -> dict[str, Any]:
     """Get detailed information about a specific gift.
 
     Args:
         gift_id: The unique identifier of the gift.
         vector_store: Vector store for retrieving gift data.
+        details_cache: Optional cache of prefetched gifts checked before
+            hitting the vector store.
 
     Returns:
         MCP-formatted response with gift details or error.
     """
-    gift = await vector_store.get_by_id(gift_id)
+    gift: Gift | None = None
+    if details_cache is not None:
+        gift = details_cache.get(gift_id)
+
+    if gift is None:
+        gift = await vector_store.get_by_id(gift_id)
+        if gift is not None and details_cache is not None:
+            details_cache.put(gift_id, gift)
 
     if gift is None:
         return {
@@ -1,21 +1,38 @@
 """MCP tool handler for get_recommendations."""
 
+import asyncio
 from typing import Any
 
 import structlog
 from pydantic import ValidationError
 
+from src.adapters.mcp.details_cache import GiftDetailsCache
+from src.adapters.mcp.semantic_cache import SemanticResponseCache
 from src.domain.entities.recommendation_request import RecommendationRequest
+from src.domain.ports.vector_store import VectorStorePort
 from src.domain.services.recommendation_service import RecommendationService
 
 logger = structlog.get_logger(__name__)
 
+# Prefetch settings: how many of the returned gifts to warm into the
+# details cache, and how many lookups may run concurrently so the
+# speculative work never starves the serving path.
+_PREFETCH_TOP_K = 5
+_PREFETCH_CONCURRENCY = 4
+
+# The loop holds only weak refs to tasks; keep prefetches alive here so
+# GC can't drop one mid-flight
+_prefetch_tasks: set[asyncio.Task[None]] = set()
+
 
 async def get_recommendations_handler(
     keywords: str,
     service: RecommendationService,
     negative_keywords: str | None = None,
     limit: int | None = None,
+    semantic_cache: SemanticResponseCache | None = None,
+    vector_store: VectorStorePort | None = None,
+    details_cache: GiftDetailsCache | None = None,
 ) -> dict[str, Any]:
     """Handle get_recommendations MCP tool call.
 
@@ -24,6 +41,11 @@ async def get_recommendations_handler(
         service: The recommendation service instance.
         negative_keywords: Optional keywords to avoid in results.
         limit: Optional limit on number of recommendations.
+        semantic_cache: Optional cache returning stored responses for
+            near-duplicate queries.
+        vector_store: Optional vector store used to prefetch details for
+            the returned gifts.
+        details_cache: Optional cache the prefetched gifts are stored in.
 
     Returns:
         MCP structured response with gifts and metadata.
@@ -35,6 +57,12 @@ async def get_recommendations_handler(
         limit=limit,
     )
 
+    # Kick off the embedding round trip immediately so it overlaps with
+    # request validation and logging instead of running after them.
+    embed_task: asyncio.Task[list[float]] | None = None
+    if semantic_cache is not None:
+        embed_task = asyncio.create_task(service.embed_query(keywords))
+
     try:
         # Build request with validation
         request = RecommendationRequest(
@@ -43,6 +71,17 @@ async def get_recommendations_handler(
             limit=limit or 5,
         )
 
+        # Near-duplicate queries are answered from the semantic cache
+        # without re-running the embed + vector-search pipeline.
+        query_embedding: list[float] | None = None
+        cache_options = (negative_keywords, request.limit)
+        if semantic_cache is not None and embed_task is not None:
+            query_embedding = await embed_task
+            cached = semantic_cache.lookup(query_embedding, options=cache_options)
+            if cached is not None:
+                log.info("recommendation_request_cached")
+                return cached
+
         log.info("processing_recommendation_request")
 
         # Get recommendations from service
@@ -55,17 +94,75 @@ async def get_recommendations_handler(
         )
 
         # Build MCP structured response
-        return _build_structured_response(response)
+        result = _build_structured_response(response)
+
+        if semantic_cache is not None and query_embedding is not None:
+            semantic_cache.store(query_embedding, result, options=cache_options)
+
+        # Speculatively warm the details cache for the returned gifts:
+        # the client almost always calls get_gift_details next.
+        if vector_store is not None and details_cache is not None and response.gifts:
+            task = asyncio.create_task(
+                _prefetch_details(
+                    gift_ids=[gift.id for gift in response.gifts[:_PREFETCH_TOP_K]],
+                    vector_store=vector_store,
+                    details_cache=details_cache,
+                )
+            )
+            _prefetch_tasks.add(task)
+            task.add_done_callback(_prefetch_tasks.discard)
+
+        return result
 
     except ValidationError as e:
+        if embed_task is not None and not embed_task.done():
+            embed_task.cancel()
         log.warning("validation_error", errors=e.errors())
         return _build_error_response(str(e))
 
     except Exception as e:
+        if embed_task is not None and not embed_task.done():
+            embed_task.cancel()
         log.error("recommendation_error", error=str(e))
         return _build_error_response(f"Failed to get recommendations: {e}")
 
 
+async def _prefetch_details(
+    gift_ids: list[str],
+    vector_store: VectorStorePort,
+    details_cache: GiftDetailsCache,
+) -> None:
+    """Prefetch gifts into the details cache with bounded concurrency.
+
+    Args:
+        gift_ids: IDs of the gifts to prefetch.
+        vector_store: Vector store to fetch the gifts from.
+        details_cache: Cache the fetched gifts are stored in.
+    """
+
+    if not gift_ids:
+        return
+
+    # Created per call: a module-level Semaphore binds to the first event
+    # loop that contends it and breaks on any later loop. One gather only
+    # needs a local bound anyway.
+    semaphore = asyncio.Semaphore(_PREFETCH_CONCURRENCY)
+
+    async def fetch(gift_id: str) -> None:
+        async with semaphore:
+            if details_cache.get(gift_id) is not None:
+                return
+            try:
+                gift = await vector_store.get_by_id(gift_id)
+            except Exception as e:
+                logger.debug("details_prefetch_failed", gift_id=gift_id, error=str(e))
+                return
+            if gift is not None:
+                details_cache.put(gift_id, gift)
+
+    await asyncio.gather(*(fetch(gift_id) for gift_id in gift_ids))
+
+
 def _build_structured_response(response: Any) -> dict[str, Any]:
     """Build MCP structured content response.
 
@@ -75,27 +172,23 @@ def _build_structured_response(response: Any) -> dict[str, Any]:
     Returns:
         MCP-formatted response with structuredContent and content.
     """
-    # Structured content for programmatic access (UI rendering)
-    structured_content = {
-        "gifts": [
-            {
-                "id": gift.id,
-                "name": gift.name,
-                "brief_description": gift.brief_description,
-                "relevance_score": gift.relevance_score,
-                "price_range": gift.price_range.value,
-                "categories": gift.categories,
-            }
-            for gift in response.gifts
-        ],
-    }
+    # Single pass over the gifts builds both the structured payload and
+    # the human-readable lines (capped at 5). model_dump(mode="json") runs
+    # in pydantic-core (Rust), so the per-gift dict and enum-to-value
+    # conversion skip the Python interpreter.
+    gift_dicts: list[dict[str, Any]] = []
+    gift_lines: list[str] = []
+    for gift in response.gifts:
+        gift_dicts.append(gift.model_dump(mode="json"))
+        if len(gift_lines) < 5:
+            gift_lines.append(
+                f"- {gift.name}: {gift.brief_description} ({gift.price_range.value})"
+            )
+
+    structured_content = {"gifts": gift_dicts}
 
     # Human-readable content for LLM/text display
-    if response.gifts:
-        gift_lines = [
-            f"- {gift.name}: {gift.brief_description} ({gift.price_range.value})"
-            for gift in response.gifts[:5]
-        ]
+    if gift_lines:
         content = f"Found {len(response.gifts)} gift recommendations:\n" + "\n".join(gift_lines)
     else:
         content = "No gift recommendations found matching the description."
@@ -1,10 +1,20 @@
 """AWS S3 Vectors adapter implementing VectorStorePort."""
 
+import asyncio
+import hashlib
+import struct
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 
 import boto3
+import numpy as np
 import structlog
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from src.domain.entities.gift import Gift
@@ -13,6 +23,16 @@ from src.domain.ports.vector_store import VectorStorePort
 
 logger = structlog.get_logger()
 
+# Enum construction goes through __call__/_missing_ on every lookup; a
+# plain dict resolves metadata values in one hash probe
+_PRICE_RANGE_BY_VALUE: dict[str, PriceRange] = {pr.value: pr for pr in PriceRange}
+
+
+@lru_cache(maxsize=4096)
+def _parse_uuid(gift_id: str) -> UUID:
+    """Parse a gift ID string, memoized since the same IDs recur often."""
+    return UUID(gift_id)
+
 
 class S3VectorsAdapter(VectorStorePort):
     """AWS S3 Vectors storage adapter for gift embeddings.
@@ -23,6 +43,15 @@ class S3VectorsAdapter(VectorStorePort):
     See: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3vectors.html
     """
 
+    # Recommendation queries repeat across sessions; identical searches
+    # within the TTL are served from memory instead of an S3 round trip
+    SEARCH_CACHE_SIZE = 1024
+    SEARCH_CACHE_TTL = 300.0
+
+    # get_index only changes when vectors are written; count/health reads
+    # within the TTL reuse the last description
+    INDEX_DESC_TTL = 300.0
+
     def __init__(
         self,
         bucket: str,
@@ -30,6 +59,8 @@ class S3VectorsAdapter(VectorStorePort):
         region: str = "us-east-1",
         aws_access_key_id: str | None = None,
         aws_secret_access_key: str | None = None,
+        max_pool_connections: int = 64,
+        overfetch_factor: int = 4,
     ) -> None:
         """Initialize the S3 Vectors client.
 
@@ -39,18 +70,38 @@ class S3VectorsAdapter(VectorStorePort):
             region: AWS region
             aws_access_key_id: AWS access key (optional, uses default chain if not provided)
             aws_secret_access_key: AWS secret key (optional, uses default chain if not provided)
+            max_pool_connections: HTTP connection pool size; raise under
+                heavy concurrent search load
+            overfetch_factor: topK multiplier for the retry query when
+                threshold filtering leaves a search short of its limit
         """
         self._bucket = bucket
         self._index_name = index_name
         self._region = region
-
-        # Build client with explicit credentials if provided
-        client_kwargs: dict[str, Any] = {"region_name": region}
+        self._overfetch_factor = overfetch_factor
+
+        # Build client with explicit credentials if provided. The botocore
+        # defaults (10 pooled connections, no keepalive) recycle TLS under
+        # bursty concurrent load; a larger keepalive pool with adaptive
+        # retries keeps connections warm instead.
+        client_kwargs: dict[str, Any] = {
+            "region_name": region,
+            "config": Config(
+                max_pool_connections=max_pool_connections,
+                tcp_keepalive=True,
+                retries={"max_attempts": 2, "mode": "adaptive"},
+            ),
+        }
         if aws_access_key_id and aws_secret_access_key:
             client_kwargs["aws_access_key_id"] = aws_access_key_id
             client_kwargs["aws_secret_access_key"] = aws_secret_access_key
 
         self._client = boto3.client("s3vectors", **client_kwargs)
+        self._search_cache: OrderedDict[
+            tuple[bytes, int, float], tuple[list[tuple[Gift, float]], float]
+        ] = OrderedDict()
+        self._index_desc: tuple[dict[str, Any], float] | None = None
+        self._name_index: dict[str, str] | None = None
         self._log = logger.bind(adapter="s3_vectors", bucket=bucket, index=index_name)
 
     async def search_similar(
@@ -69,53 +120,182 @@ class S3VectorsAdapter(VectorStorePort):
         Returns:
             List of (Gift, similarity_score) tuples
         """
+        cache_key = (
+            hashlib.sha256(struct.pack(f"{len(embedding)}f", *embedding)).digest(),
+            limit,
+            threshold,
+        )
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            results, cached_at = cached
+            if time.monotonic() - cached_at < self.SEARCH_CACHE_TTL:
+                self._search_cache.move_to_end(cache_key)
+                self._log.debug("search_cache_hit", results_count=len(results))
+                return list(results)
+            del self._search_cache[cache_key]
+
         self._log.debug("search_similar", limit=limit, threshold=threshold)
 
         try:
-            response = self._client.query_vectors(
-                vectorBucketName=self._bucket,
-                indexName=self._index_name,
-                queryVector={"float32": embedding},
-                topK=limit * 2,  # Fetch extra to filter by threshold
-                returnDistance=True,
-                returnMetadata=True,
+            match_count, results = await self._scored_query(
+                embedding, top_k=limit, limit=limit, threshold=threshold
             )
 
-            results: list[tuple[Gift, float]] = []
-            distance_metric = response.get("distanceMetric", "cosine")
-
-            for match in response.get("vectors", []):
-                # Convert distance to similarity score
-                # For cosine distance: similarity = 1 - distance
-                # For euclidean: we'd need different conversion
-                distance = match.get("distance", 1.0)
-                if distance_metric == "cosine":
-                    score = 1.0 - distance
-                else:
-                    # For euclidean, use inverse (smaller distance = higher score)
-                    score = 1.0 / (1.0 + distance)
-
-                if score < threshold:
-                    continue
-
-                metadata = match.get("metadata", {})
-                gift = self._metadata_to_gift(
-                    gift_key=match["key"],
-                    metadata=metadata,
-                    embedding=embedding,  # We don't get embedding back from query
+            # Threshold filtering came up short and the index may hold more
+            # candidates: retry once with a wider topK. Fetching limit first
+            # and widening only on demand beats a static limit*2 over-fetch
+            # whenever most results clear the threshold.
+            if len(results) < limit and match_count == limit:
+                match_count, results = await self._scored_query(
+                    embedding,
+                    top_k=limit * self._overfetch_factor,
+                    limit=limit,
+                    threshold=threshold,
                 )
-                results.append((gift, score))
 
-                if len(results) >= limit:
-                    break
+            self._search_cache[cache_key] = (results, time.monotonic())
+            if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
 
             self._log.debug("search_complete", results_count=len(results))
-            return results
+            return list(results)
 
         except ClientError as e:
             self._log.error("search_failed", error=str(e))
             raise
 
+    async def _scored_query(
+        self,
+        embedding: list[float],
+        top_k: int,
+        limit: int,
+        threshold: float,
+    ) -> tuple[int, list[tuple[Gift, float]]]:
+        """Run one query_vectors call and score/filter the matches.
+
+        Args:
+            embedding: Query vector
+            top_k: Number of candidates to request from the index
+            limit: Maximum results to keep after threshold filtering
+            threshold: Minimum similarity score
+
+        Returns:
+            Tuple of (raw match count, filtered (Gift, score) results)
+        """
+        response = await asyncio.to_thread(
+            self._client.query_vectors,
+            vectorBucketName=self._bucket,
+            indexName=self._index_name,
+            queryVector={"float32": embedding},
+            topK=top_k,
+            returnDistance=True,
+            returnMetadata=True,
+        )
+
+        matches = response.get("vectors", [])
+        distance_metric = response.get("distanceMetric", "cosine")
+
+        # Convert distances to similarity scores in one vectorized pass:
+        # cosine: similarity = 1 - distance; euclidean: inverse distance
+        # (smaller distance = higher score)
+        distances = np.fromiter(
+            (match.get("distance", 1.0) for match in matches),
+            dtype=np.float64,
+            count=len(matches),
+        )
+        scores = (
+            1.0 - distances
+            if distance_metric == "cosine"
+            else 1.0 / (1.0 + distances)
+        )
+
+        # Gift construction (pydantic validation) is the expensive part,
+        # so only materialize entities for matches that clear the
+        # threshold, capped at limit
+        keep = np.nonzero(scores >= threshold)[0][:limit]
+
+        results: list[tuple[Gift, float]] = [
+            (
+                self._metadata_to_gift(
+                    gift_key=matches[i]["key"],
+                    metadata=matches[i].get("metadata", {}),
+                ),
+                float(scores[i]),
+            )
+            for i in keep
+        ]
+
+        return len(matches), results
+
+    async def _iter_key_pages(self) -> AsyncIterator[list[str]]:
+        """Yield vector-key pages, prefetching the next page during processing.
+
+        The list_vectors call for page N+1 is already in flight while the
+        caller works on page N, hiding one page RTT per iteration. Closing
+        the generator early cancels the in-flight fetch.
+        """
+
+        async def fetch_page(token: str | None) -> dict[str, Any]:
+            kwargs: dict[str, Any] = {
+                "vectorBucketName": self._bucket,
+                "indexName": self._index_name,
+            }
+            if token is not None:
+                kwargs["nextToken"] = token
+            return await asyncio.to_thread(self._client.list_vectors, **kwargs)
+
+        page = await fetch_page(None)
+        while True:
+            token = page.get("nextToken")
+            next_task = (
+                asyncio.create_task(fetch_page(token)) if token is not None else None
+            )
+            try:
+                yield [v["key"] for v in page.get("vectors", [])]
+            except GeneratorExit:
+                if next_task is not None and not next_task.done():
+                    next_task.cancel()
+                raise
+            if next_task is None:
+                return
+            page = await next_task
+
+    async def _get_vectors_batched(self, keys: list[str]) -> list[dict[str, Any]]:
+        """Fetch vector records for keys in concurrent 100-key batches.
+
+        Batches go out in parallel (bounded like upsert_many) so multi-batch
+        fetches overlap their round trips; the flattened records preserve
+        batch order.
+
+        Args:
+            keys: Vector keys to fetch
+
+        Returns:
+            Flat list of vector record dicts with metadata only
+        """
+        semaphore = asyncio.Semaphore(10)
+
+        async def fetch_batch(batch_keys: list[str]) -> dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._client.get_vectors,
+                    vectorBucketName=self._bucket,
+                    indexName=self._index_name,
+                    keys=batch_keys,
+                    returnData=False,
+                    returnMetadata=True,
+                )
+
+        responses = await asyncio.gather(
+            *(fetch_batch(keys[i : i + 100]) for i in range(0, len(keys), 100))
+        )
+
+        return [
+            vector_data
+            for response in responses
+            for vector_data in response.get("vectors", [])
+        ]
+
     async def get_by_id(self, gift_id: str) -> Gift | None:
         """Retrieve a gift by its ID (key).
 
@@ -128,11 +308,12 @@ class S3VectorsAdapter(VectorStorePort):
         self._log.debug("get_by_id", gift_id=gift_id)
 
         try:
-            response = self._client.get_vectors(
+            response = await asyncio.to_thread(
+                self._client.get_vectors,
                 vectorBucketName=self._bucket,
                 indexName=self._index_name,
                 keys=[gift_id],
-                returnData=True,
+                returnData=False,
                 returnMetadata=True,
             )
 
@@ -144,7 +325,6 @@ class S3VectorsAdapter(VectorStorePort):
             return self._metadata_to_gift(
                 gift_key=vector_data["key"],
                 metadata=vector_data.get("metadata", {}),
-                embedding=vector_data.get("data", {}).get("float32", []),
             )
 
         except ClientError as e:
@@ -162,30 +342,22 @@ class S3VectorsAdapter(VectorStorePort):
         Returns:
             List of found gifts
         """
-        self._log.debug("get_by_ids", count=len(gift_ids))
-
         if not gift_ids:
             return []
 
-        try:
-            response = self._client.get_vectors(
-                vectorBucketName=self._bucket,
-                indexName=self._index_name,
-                keys=gift_ids,
-                returnData=True,
-                returnMetadata=True,
-            )
+        self._log.debug("get_by_ids", count=len(gift_ids))
 
-            gifts: list[Gift] = []
-            for vector_data in response.get("vectors", []):
-                gift = self._metadata_to_gift(
+        try:
+            gifts_by_key: dict[str, Gift] = {
+                vector_data["key"]: self._metadata_to_gift(
                     gift_key=vector_data["key"],
                     metadata=vector_data.get("metadata", {}),
-                    embedding=vector_data.get("data", {}).get("float32", []),
                 )
-                gifts.append(gift)
+                for vector_data in await self._get_vectors_batched(gift_ids)
+            }
 
-            return gifts
+            # Reassemble in input order; missing IDs are silently ignored
+            return [gifts_by_key[gid] for gid in gift_ids if gid in gifts_by_key]
 
         except ClientError as e:
             self._log.error("get_by_ids_failed", error=str(e))
@@ -207,7 +379,8 @@ class S3VectorsAdapter(VectorStorePort):
 
         try:
             # List vectors and fetch their metadata
-            response = self._client.list_vectors(
+            response = await asyncio.to_thread(
+                self._client.list_vectors,
                 vectorBucketName=self._bucket,
                 indexName=self._index_name,
                 maxResults=100,  # Fetch more to sort by popularity
@@ -218,22 +391,15 @@ class S3VectorsAdapter(VectorStorePort):
             if not keys:
                 return []
 
-            vectors_response = self._client.get_vectors(
-                vectorBucketName=self._bucket,
-                indexName=self._index_name,
-                keys=keys,
-                returnData=True,
-                returnMetadata=True,
-            )
+            vector_records = await self._get_vectors_batched(keys)
 
             # Convert to gifts and sort by popularity
             gifts_with_scores: list[tuple[Gift, float]] = []
-            for vector_data in vectors_response.get("vectors", []):
+            for vector_data in vector_records:
                 metadata = vector_data.get("metadata", {})
                 gift = self._metadata_to_gift(
                     gift_key=vector_data["key"],
                     metadata=metadata,
-                    embedding=vector_data.get("data", {}).get("float32", []),
                 )
                 score = metadata.get("popularity_score", 0.5)
                 gifts_with_scores.append((gift, score))
@@ -247,6 +413,29 @@ class S3VectorsAdapter(VectorStorePort):
             self._log.error("get_popular_failed", error=str(e))
             raise
 
+    async def _describe_index(self) -> dict[str, Any]:
+        """Fetch the index description, memoized for INDEX_DESC_TTL seconds.
+
+        get_total_count and health_check both only need vectorCount, so
+        they share one cached get_index response. Writes invalidate the
+        cache via upsert_many.
+
+        Returns:
+            get_index response dict
+        """
+        if self._index_desc is not None:
+            response, fetched_at = self._index_desc
+            if time.monotonic() - fetched_at < self.INDEX_DESC_TTL:
+                return response
+
+        response = await asyncio.to_thread(
+            self._client.get_index,
+            vectorBucketName=self._bucket,
+            indexName=self._index_name,
+        )
+        self._index_desc = (response, time.monotonic())
+        return response
+
     async def get_total_count(self) -> int:
         """Get total number of gifts in the catalog.
 
@@ -254,10 +443,7 @@ class S3VectorsAdapter(VectorStorePort):
             Total count
         """
         try:
-            response = self._client.get_index(
-                vectorBucketName=self._bucket,
-                indexName=self._index_name,
-            )
+            response = await self._describe_index()
             return response.get("vectorCount", 0)
 
         except ClientError as e:
@@ -270,39 +456,90 @@ class S3VectorsAdapter(VectorStorePort):
         Args:
             gift: Gift entity with embedding
         """
-        self._log.debug("upsert", gift_id=str(gift.id))
-
-        metadata = {
-            "id": str(gift.id),
-            "name": gift.name,
-            "brief_description": gift.brief_description,
-            "full_description": gift.full_description,
-            "price_range": gift.price_range.value,
-            "categories": gift.categories,
-            "occasions": gift.occasions,
-            "recipient_types": gift.recipient_types,
-            "popularity_score": gift.popularity_score,
-            "purchase_url": gift.purchase_url or "",
-            "has_affiliate_commission": gift.has_affiliate_commission,
-        }
+        await self.upsert_many([gift])
+
+    async def upsert_many(self, gifts: list[Gift]) -> None:
+        """Insert or update multiple gifts in a single batch call per chunk.
+
+        Vectors are sent in groups of 500 to stay under the put_vectors
+        request-size limit; catalog loads pay one RTT per chunk instead of
+        one per gift.
+
+        Args:
+            gifts: Gift entities with embeddings
+        """
+        if not gifts:
+            return
+
+        self._log.debug("upsert_many", count=len(gifts))
+
+        # Chunks go out concurrently on worker threads, bounded so a large
+        # catalog load can't monopolize the thread pool
+        semaphore = asyncio.Semaphore(10)
+
+        async def put_chunk(chunk: list[Gift]) -> None:
+            async with semaphore:
+                await asyncio.to_thread(
+                    self._client.put_vectors,
+                    vectorBucketName=self._bucket,
+                    indexName=self._index_name,
+                    vectors=[self._gift_to_vector(gift) for gift in chunk],
+                )
 
         try:
-            self._client.put_vectors(
-                vectorBucketName=self._bucket,
-                indexName=self._index_name,
-                vectors=[
-                    {
-                        "key": str(gift.id),
-                        "data": {"float32": gift.embedding},
-                        "metadata": metadata,
-                    }
-                ],
+            await asyncio.gather(
+                *(
+                    put_chunk(gifts[i : i + 500])
+                    for i in range(0, len(gifts), 500)
+                )
             )
-            self._log.debug("upsert_complete", gift_id=str(gift.id))
+
+            self._log.debug("upsert_many_complete", count=len(gifts))
 
         except ClientError as e:
-            self._log.error("upsert_failed", gift_id=str(gift.id), error=str(e))
+            self._log.error("upsert_failed", count=len(gifts), error=str(e))
             raise
+        finally:
+            # The catalog may have changed even on failure (gather does not
+            # undo chunks that already landed), so invalidate the memoized
+            # count, the name index, and cached search results regardless
+            self._index_desc = None
+            self._name_index = None
+            self._search_cache.clear()
+
+    def _gift_to_vector(self, gift: Gift) -> dict[str, Any]:
+        """Convert a Gift entity to a put_vectors payload entry.
+
+        Args:
+            gift: Gift entity with embedding
+
+        Returns:
+            Vector dict with key, data, and metadata
+
+        Raises:
+            ValueError: If the gift has no embedding to store
+        """
+        if gift.embedding is None:
+            raise ValueError(f"Gift {gift.id} has no embedding to upsert")
+
+        gift_id = gift.id_str
+        return {
+            "key": gift_id,
+            "data": {"float32": gift.embedding},
+            "metadata": {
+                "id": gift_id,
+                "name": gift.name,
+                "brief_description": gift.brief_description,
+                "full_description": gift.full_description,
+                "price_range": gift.price_range.value,
+                "categories": gift.categories,
+                "occasions": gift.occasions,
+                "recipient_types": gift.recipient_types,
+                "popularity_score": gift.popularity_score,
+                "purchase_url": gift.purchase_url or "",
+                "has_affiliate_commission": gift.has_affiliate_commission,
+            },
+        }
 
     async def find_by_name(self, name: str) -> Gift | None:
         """Find a gift by its exact name.
@@ -318,38 +555,26 @@ class S3VectorsAdapter(VectorStorePort):
         """
         self._log.debug("find_by_name", name=name)
 
-        try:
-            # List all vectors and filter by name
-            paginator = self._client.get_paginator("list_vectors")
+        # A warmed name index answers in one hash lookup plus at most one
+        # keyed fetch, instead of a full catalog scan
+        if self._name_index is not None:
+            key = self._name_index.get(name)
+            return await self.get_by_id(key) if key is not None else None
 
-            for page in paginator.paginate(
-                vectorBucketName=self._bucket,
-                indexName=self._index_name,
-            ):
-                keys = [v["key"] for v in page.get("vectors", [])]
-                if not keys:
-                    continue
-
-                # Batch keys in groups of 100 (S3 Vectors API limit)
-                for i in range(0, len(keys), 100):
-                    batch_keys = keys[i : i + 100]
-
-                    # Get metadata for this batch
-                    vectors_response = self._client.get_vectors(
-                        vectorBucketName=self._bucket,
-                        indexName=self._index_name,
-                        keys=batch_keys,
-                        returnData=True,
-                        returnMetadata=True,
-                    )
-
-                    for vector_data in vectors_response.get("vectors", []):
+        try:
+            # Scan page by page: the next key page is prefetched while the
+            # current page's metadata batches are fetched and scanned
+            async with aclosing(self._iter_key_pages()) as pages:
+                async for keys in pages:
+                    if not keys:
+                        continue
+
+                    for vector_data in await self._get_vectors_batched(keys):
                         metadata = vector_data.get("metadata", {})
                         if metadata.get("name") == name:
                             return self._metadata_to_gift(
                                 gift_key=vector_data["key"],
                                 metadata=metadata,
-                                embedding=vector_data.get("data", {}).get("float32", []),
                             )
 
             return None
@@ -358,6 +583,35 @@ class S3VectorsAdapter(VectorStorePort):
             self._log.error("find_by_name_failed", name=name, error=str(e))
             raise
 
+    async def get_name_index(self) -> dict[str, str]:
+        """Build a mapping of gift name to vector key for the whole catalog.
+
+        One paginated scan replaces repeated find_by_name calls for bulk
+        ingestion: callers resolve names locally instead of re-scanning
+        the index per lookup.
+
+        Returns:
+            Dict mapping gift name to its vector key
+        """
+        self._log.debug("get_name_index")
+
+        try:
+            name_index: dict[str, str] = {}
+            async with aclosing(self._iter_key_pages()) as pages:
+                async for keys in pages:
+                    for vector_data in await self._get_vectors_batched(keys):
+                        name = vector_data.get("metadata", {}).get("name")
+                        if name:
+                            name_index[name] = vector_data["key"]
+
+            self._name_index = name_index
+            self._log.debug("name_index_built", count=len(name_index))
+            return name_index
+
+        except ClientError as e:
+            self._log.error("get_name_index_failed", error=str(e))
+            raise
+
     async def ensure_index_exists(self, dimensions: int = 1536) -> bool:
         """Create the vector bucket and index if they don't exist.
 
@@ -371,7 +625,8 @@ class S3VectorsAdapter(VectorStorePort):
 
         try:
             # Check if index already exists
-            self._client.get_index(
+            await asyncio.to_thread(
+                self._client.get_index,
                 vectorBucketName=self._bucket,
                 indexName=self._index_name,
             )
@@ -384,7 +639,8 @@ class S3VectorsAdapter(VectorStorePort):
 
         # Try to create the bucket first (may already exist)
         try:
-            self._client.create_vector_bucket(
+            await asyncio.to_thread(
+                self._client.create_vector_bucket,
                 vectorBucketName=self._bucket,
             )
             self._log.info("created_vector_bucket", bucket=self._bucket)
@@ -394,7 +650,8 @@ class S3VectorsAdapter(VectorStorePort):
             self._log.debug("bucket_already_exists")
 
         # Create the index
-        self._client.create_index(
+        await asyncio.to_thread(
+            self._client.create_index,
             vectorBucketName=self._bucket,
             indexName=self._index_name,
             dataType="float32",
@@ -411,10 +668,7 @@ class S3VectorsAdapter(VectorStorePort):
             Health status information
         """
         try:
-            response = self._client.get_index(
-                vectorBucketName=self._bucket,
-                indexName=self._index_name,
-            )
+            response = await self._describe_index()
             return {
                 "status": "healthy",
                 "bucket": self._bucket,
@@ -434,37 +688,44 @@ class S3VectorsAdapter(VectorStorePort):
         self,
         gift_key: str,
         metadata: dict[str, Any],
-        embedding: list[float],
+        embedding: list[float] | None = None,
     ) -> Gift:
         """Convert S3 Vectors metadata to Gift entity.
 
         Args:
             gift_key: Vector key (used as ID if not in metadata)
             metadata: S3 Vectors metadata dict
-            embedding: Vector embedding
+            embedding: Vector embedding, if the caller fetched one
 
         Returns:
             Gift entity
         """
+        # Bind the bound method once; this runs per match on the hot
+        # search path and saves a LOAD_METHOD per field
+        get = metadata.get
+
         # Use ID from metadata if available, otherwise use key
-        gift_id = metadata.get("id", gift_key)
-        purchase_url = metadata.get("purchase_url", "")
+        gift_id = get("id", gift_key)
+        purchase_url = get("purchase_url", "")
 
-        # Ensure embedding has correct dimensions (pad if needed for queries)
+        # Read paths skip vector data (~6 KB per gift) since nothing
+        # downstream ranks on it after retrieval
         if not embedding or len(embedding) != 1536:
-            embedding = [0.0] * 1536
+            embedding = None
 
         return Gift(
-            id=UUID(gift_id) if isinstance(gift_id, str) else gift_id,
-            name=metadata.get("name", ""),
-            brief_description=metadata.get("brief_description", ""),
-            full_description=metadata.get("full_description", ""),
-            price_range=PriceRange(metadata.get("price_range", "moderate")),
-            categories=metadata.get("categories", []),
-            occasions=metadata.get("occasions", []),
-            recipient_types=metadata.get("recipient_types", []),
+            id=_parse_uuid(gift_id) if isinstance(gift_id, str) else gift_id,
+            name=get("name", ""),
+            brief_description=get("brief_description", ""),
+            full_description=get("full_description", ""),
+            price_range=_PRICE_RANGE_BY_VALUE.get(
+                get("price_range", "moderate"), PriceRange.MODERATE
+            ),
+            categories=get("categories", []),
+            occasions=get("occasions", []),
+            recipient_types=get("recipient_types", []),
             embedding=embedding,
-            popularity_score=metadata.get("popularity_score", 0.5),
+            popularity_score=get("popularity_score", 0.5),
             purchase_url=purchase_url if purchase_url else None,
-            has_affiliate_commission=metadata.get("has_affiliate_commission", False),
+            has_affiliate_commission=get("has_affiliate_commission", False),
         )
@@ -102,38 +102,61 @@ async def upload_gifts(
     updated_count = 0
     error_count = 0
 
+    # Stage 1: parse and validate every row up front, so network work
+    # happens in batches instead of one round trip per row
+    parsed_rows: list[dict] = []
+
     with open(csv_path, newline="", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
+        # csv.reader with positional indexing skips the per-row dict that
+        # DictReader allocates; column indices are resolved once from the
+        # header and bound to locals before the loop
+        reader = csv.reader(csvfile)
 
-        # Validate columns
-        if reader.fieldnames is None:
+        header = next(reader, None)
+        if header is None:
             log.error("empty_csv")
             return 0, 0, 1
 
-        missing_columns = set(REQUIRED_COLUMNS) - set(reader.fieldnames)
+        column_index = {column: i for i, column in enumerate(header)}
+
+        missing_columns = set(REQUIRED_COLUMNS) - column_index.keys()
         if missing_columns:
             log.error("missing_required_columns", missing=list(missing_columns))
             print(f"Error: Missing required columns: {missing_columns}")
             print(f"Required columns: {REQUIRED_COLUMNS}")
             return 0, 0, 1
 
+        def cell(row: list[str], index: int | None, default: str = "") -> str:
+            """Read a column from a row, tolerating short rows and absent columns."""
+            if index is None or index >= len(row):
+                return default
+            return row[index]
+
+        name_i = column_index["name"]
+        brief_i = column_index["brief_description"]
+        full_i = column_index["full_description"]
+        price_i = column_index["price_range"]
+        categories_i = column_index["categories"]
+        occasions_i = column_index.get("occasions")
+        recipients_i = column_index.get("recipient_types")
+        purchase_i = column_index.get("purchase_url")
+        affiliate_i = column_index.get("has_affiliate_commission")
+        popularity_i = column_index.get("popularity_score")
+
         for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
             try:
-                name = row["name"].strip()
+                name = cell(row, name_i).strip()
                 if not name:
                     log.warning("skipping_empty_name", row=row_num)
                     continue
 
                 log.debug("processing_row", row=row_num, name=name)
 
-                # Check if gift already exists
-                existing_gift = await vector_store.find_by_name(name)
-
                 # Parse row data
-                brief_description = row["brief_description"].strip()
-                full_description = row["full_description"].strip()
-                price_range = PriceRange(row["price_range"].strip().lower())
-                categories = parse_list(row["categories"])
+                brief_description = cell(row, brief_i).strip()
+                full_description = cell(row, full_i).strip()
+                price_range = PriceRange(cell(row, price_i).strip().lower())
+                categories = parse_list(cell(row, categories_i))
 
                 if not categories:
                     log.warning("skipping_no_categories", row=row_num, name=name)
@@ -141,16 +164,13 @@ async def upload_gifts(
                     continue
 
                 # Optional fields
-                occasions = parse_list(row.get("occasions", ""))
-                recipient_types = parse_list(row.get("recipient_types", ""))
-                purchase_url = row.get("purchase_url", "").strip() or None
-                has_affiliate = parse_bool(row.get("has_affiliate_commission", "false"))
-                popularity = parse_float(row.get("popularity_score", "0.5"), 0.5)
+                occasions = parse_list(cell(row, occasions_i))
+                recipient_types = parse_list(cell(row, recipients_i))
+                purchase_url = cell(row, purchase_i).strip() or None
+                has_affiliate = parse_bool(cell(row, affiliate_i, "false"))
+                popularity = parse_float(cell(row, popularity_i, "0.5"), 0.5)
 
-                # Use existing ID if updating, otherwise generate new
-                gift_id = existing_gift.id if existing_gift else uuid4()
-
-                # Generate embedding from gift content (include all searchable fields)
+                # Embedding text from gift content (include all searchable fields)
                 embedding_parts = [
                     name,
                     brief_description,
@@ -160,45 +180,110 @@ async def upload_gifts(
                     embedding_parts.append(f"Occasions: {', '.join(occasions)}")
                 if recipient_types:
                     embedding_parts.append(f"Good for: {', '.join(recipient_types)}")
-                embedding_text = ". ".join(embedding_parts)
-                embedding = await embedding_adapter.embed_text(embedding_text)
-
-                # Create gift entity
-                gift = Gift(
-                    id=gift_id,
-                    name=name,
-                    brief_description=brief_description,
-                    full_description=full_description,
-                    price_range=price_range,
-                    categories=categories,
-                    occasions=occasions,
-                    recipient_types=recipient_types,
-                    embedding=embedding,
-                    popularity_score=popularity,
-                    purchase_url=purchase_url,
-                    has_affiliate_commission=has_affiliate,
-                )
 
-                if dry_run:
-                    action = "update" if existing_gift else "create"
-                    print(f"[DRY RUN] Would {action}: {name}")
-                else:
-                    await vector_store.upsert(gift)
-
-                if existing_gift:
-                    updated_count += 1
-                    log.info("updated_gift", name=name, gift_id=str(gift_id))
-                    print(f"Updated: {name}")
-                else:
-                    created_count += 1
-                    log.info("created_gift", name=name, gift_id=str(gift_id))
-                    print(f"Created: {name}")
+                parsed_rows.append(
+                    {
+                        "row_num": row_num,
+                        "name": name,
+                        "brief_description": brief_description,
+                        "full_description": full_description,
+                        "price_range": price_range,
+                        "categories": categories,
+                        "occasions": occasions,
+                        "recipient_types": recipient_types,
+                        "purchase_url": purchase_url,
+                        "has_affiliate_commission": has_affiliate,
+                        "popularity_score": popularity,
+                        "embedding_text": ". ".join(embedding_parts),
+                    }
+                )
 
             except Exception as e:
                 error_count += 1
                 log.error("row_error", row=row_num, error=str(e))
                 print(f"Error on row {row_num}: {e}")
 
+    if not parsed_rows:
+        log.info("upload_complete", created=0, updated=0, errors=error_count)
+        return 0, 0, error_count
+
+    # Stage 2: one catalog scan resolves every name locally, replacing
+    # the per-row find_by_name scan (O(N^2) listing for N rows)
+    try:
+        name_index = await vector_store.get_name_index()
+    except Exception as e:
+        error_count += len(parsed_rows)
+        log.error("name_index_failed", error=str(e))
+        print(f"Error listing existing gifts: {e}")
+        return created_count, updated_count, error_count
+
+    # Stage 3: embed all texts in batched API calls (2048 inputs max per
+    # OpenAI request), then upsert in chunked put_vectors calls
+    if dry_run:
+        for parsed in parsed_rows:
+            action = "update" if parsed["name"] in name_index else "create"
+            print(f"[DRY RUN] Would {action}: {parsed['name']}")
+            if parsed["name"] in name_index:
+                updated_count += 1
+            else:
+                created_count += 1
+        log.info(
+            "upload_complete",
+            created=created_count,
+            updated=updated_count,
+            errors=error_count,
+        )
+        return created_count, updated_count, error_count
+
+    texts = [parsed["embedding_text"] for parsed in parsed_rows]
+    embeddings: list[list[float]] = []
+    try:
+        for i in range(0, len(texts), 2048):
+            embeddings.extend(await embedding_adapter.embed_texts(texts[i : i + 2048]))
+    except Exception as e:
+        error_count += len(parsed_rows)
+        log.error("embedding_failed", count=len(texts), error=str(e))
+        print(f"Error embedding {len(texts)} gifts: {e}")
+        return created_count, updated_count, error_count
+
+    gifts: list[Gift] = []
+    for parsed, embedding in zip(parsed_rows, embeddings, strict=True):
+        existing_key = name_index.get(parsed["name"])
+        gifts.append(
+            Gift(
+                id=existing_key if existing_key else uuid4(),
+                name=parsed["name"],
+                brief_description=parsed["brief_description"],
+                full_description=parsed["full_description"],
+                price_range=parsed["price_range"],
+                categories=parsed["categories"],
+                occasions=parsed["occasions"],
+                recipient_types=parsed["recipient_types"],
+                embedding=embedding,
+                popularity_score=parsed["popularity_score"],
+                purchase_url=parsed["purchase_url"],
+                has_affiliate_commission=parsed["has_affiliate_commission"],
+            )
+        )
+
+    try:
+        await vector_store.upsert_many(gifts)
+    except Exception as e:
+        error_count += len(gifts)
+        log.error("upsert_failed", count=len(gifts), error=str(e))
+        print(f"Error uploading {len(gifts)} gifts: {e}")
+        return created_count, updated_count, error_count
+
+    for gift in gifts:
+        if gift.name in name_index:
+            updated_count += 1
+            log.info("updated_gift", name=gift.name, gift_id=str(gift.id))
+            print(f"Updated: {gift.name}")
+        else:
+            created_count += 1
+            log.info("created_gift", name=gift.name, gift_id=str(gift.id))
+            print(f"Created: {gift.name}")
+
     log.info(
         "upload_complete",
         created=created_count,
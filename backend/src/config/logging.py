@@ -22,10 +22,11 @@ def configure_logging(log_level: str = "INFO") -> None:
         level=numeric_level,
     )
 
-    # Configure structlog
+    # Configure structlog. The filtering wrapper class short-circuits
+    # below-level calls before any bind/processor work runs, so debug
+    # logging on hot paths costs a single level comparison in production.
     structlog.configure(
         processors=[
-            structlog.stdlib.filter_by_level,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
             structlog.stdlib.PositionalArgumentsFormatter(),
@@ -35,7 +36,7 @@ def configure_logging(log_level: str = "INFO") -> None:
             structlog.processors.UnicodeDecoder(),
             structlog.processors.JSONRenderer(),
         ],
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
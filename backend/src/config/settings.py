@@ -1,5 +1,7 @@
 """Application settings using pydantic-settings."""
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -24,6 +26,7 @@ class Settings(BaseSettings):
     # S3 Vectors Configuration
     s3_vectors_bucket: str = "ribs-gift-recommendations"
     s3_vectors_index: str = "gifts"
+    s3_vectors_max_pool: int = 64  # HTTP connection pool size for the s3vectors client
 
     # Server Configuration
     mcp_server_name: str = "gift-recommendations"
@@ -34,14 +37,33 @@ class Settings(BaseSettings):
     mcp_host: str = "127.0.0.1"
     mcp_port: int = 3001
 
+    # Embedding Cache Configuration
+    embedding_cache_capacity: int = 10_000
+    embedding_cache_ttl: float | None = None  # Seconds; None disables expiry
+    embedding_cache_path: str | None = None  # SQLite file; None = memory only
+    embedding_fuzzy_cache: bool = False  # Reuse embeddings for near-duplicates
+    embedding_batch_window_ms: float = 8.0
+    embedding_batch_max: int = 64
+
+    # Semantic Cache Configuration
+    semantic_cache_threshold: float = 0.86
+    semantic_cache_capacity: int = 512
+    semantic_cache_ttl: float = 300.0  # Seconds
+
     # Recommendation Settings
     default_recommendation_limit: int = 5
     min_recommendation_limit: int = 3
     max_recommendation_limit: int = 10
     relevance_threshold: float = 0.5
     embedding_dimensions: int = 1536
+    search_overfetch_factor: int = 4  # topK multiplier when a search comes up short
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get cached settings instance."""
+    """Get cached settings instance.
+
+    Settings construction re-reads .env and os.environ and runs pydantic
+    validation; callers share one instance per process instead.
+    """
     return Settings()
@@ -1,6 +1,7 @@
 """Development MCP server with mock adapters for testing with MCP Inspector."""
 
 import random
+from functools import lru_cache
 from typing import Any
 from uuid import UUID, uuid4
 
@@ -93,19 +94,31 @@ SAMPLE_GIFTS = [
 ]
 
 
+@lru_cache(maxsize=4096)
+def _mock_embedding(text: str) -> list[float]:
+    """Build a deterministic mock embedding for a text (memoized).
+
+    Uses a local random.Random so repeated embeds don't reseed the global
+    RNG (which also perturbed every other random consumer in the process).
+    """
+    rng = random.Random(hash(text) % 10000)
+    return [rng.random() for _ in range(1536)]
+
+
 class MockEmbeddingProvider(EmbeddingProviderPort):
     """Mock embedding provider for development."""
 
     async def embed_text(self, text: str) -> list[float]:
         """Return a deterministic mock embedding based on text."""
-        # Create a simple deterministic embedding based on text hash
-        seed = hash(text) % 10000
-        random.seed(seed)
-        return [random.random() for _ in range(1536)]
+        # Repeated Inspector queries hit the memoized vector instead of
+        # paying 1536 RNG draws per call
+        return _mock_embedding(text)
 
     async def embed_texts(self, texts: list[str]) -> list[list[float]]:
-        """Embed multiple texts."""
-        return [await self.embed_text(t) for t in texts]
+        """Embed multiple texts in one pass over the memoized generator."""
+        # No await per text: the whole batch resolves synchronously
+        # against the cache without bouncing through the event loop
+        return [_mock_embedding(t) for t in texts]
 
     def get_dimensions(self) -> int:
         """Return embedding dimensions."""
@@ -120,7 +133,14 @@ class MockVectorStore(VectorStorePort):
     """Mock vector store with sample gifts for development."""
 
     def __init__(self, gifts: list[Gift]) -> None:
-        self._gifts = {str(g.id): g for g in gifts}
+        # Keyed by UUID.int: one-word hashes instead of 36-char strings,
+        # with string parsing paid once at the API boundary
+        self._gifts = {g.id.int: g for g in gifts}
+        self._values: tuple[Gift, ...] = tuple(self._gifts.values())
+        self._popular_sorted: list[tuple[Gift, float]] | None = None
+        # Instance RNG: skips the module-level lock and keeps dev results
+        # reproducible per store instead of bleeding global state
+        self._rng = random.Random(0)
 
     async def search_similar(
         self,
@@ -129,31 +149,38 @@ class MockVectorStore(VectorStorePort):
         threshold: float = 0.5,
     ) -> list[tuple[Gift, float]]:
         """Return sample gifts with mock similarity scores."""
-        gifts = list(self._gifts.values())
-        # Shuffle to simulate different results
-        random.shuffle(gifts)
-        results = []
-        for i, gift in enumerate(gifts[:limit]):
-            score = 0.95 - (i * 0.05)  # Decreasing scores
-            results.append((gift, score))
-        return results
+        # Sample simulates varied results in O(limit) instead of
+        # materializing and shuffling the whole catalog per query
+        picked = self._rng.sample(self._values, k=min(limit, len(self._values)))
+        return [(gift, 0.95 - i * 0.05) for i, gift in enumerate(picked)]
 
     async def get_by_id(self, gift_id: str) -> Gift | None:
         """Get a gift by ID."""
-        return self._gifts.get(gift_id)
+        try:
+            key = UUID(gift_id).int
+        except ValueError:
+            return None
+        return self._gifts.get(key)
 
     async def get_by_ids(self, gift_ids: list[str]) -> list[Gift]:
         """Get multiple gifts by ID."""
-        return [self._gifts[gid] for gid in gift_ids if gid in self._gifts]
+        keys = []
+        for gid in gift_ids:
+            try:
+                keys.append(UUID(gid).int)
+            except ValueError:
+                continue
+        return [self._gifts[k] for k in keys if k in self._gifts]
 
     async def get_popular(self, limit: int = 5) -> list[tuple[Gift, float]]:
-        """Get popular gifts."""
-        sorted_gifts = sorted(
-            self._gifts.values(),
-            key=lambda g: g.popularity_score,
-            reverse=True,
-        )
-        return [(g, g.popularity_score) for g in sorted_gifts[:limit]]
+        """Get popular gifts (sorted once, re-sorted only after writes)."""
+        if self._popular_sorted is None:
+            self._popular_sorted = sorted(
+                ((g, g.popularity_score) for g in self._gifts.values()),
+                key=lambda gs: gs[1],
+                reverse=True,
+            )
+        return self._popular_sorted[:limit]
 
     async def get_total_count(self) -> int:
         """Get total gift count."""
@@ -161,7 +188,9 @@ class MockVectorStore(VectorStorePort):
 
     async def upsert(self, gift: Gift) -> None:
         """Add or update a gift."""
-        self._gifts[str(gift.id)] = gift
+        self._gifts[gift.id.int] = gift
+        self._values = tuple(self._gifts.values())
+        self._popular_sorted = None
 
     async def find_by_name(self, name: str) -> Gift | None:
         """Find a gift by name."""
@@ -1,5 +1,7 @@
 """Gift entity representing a recommendation item."""
 
+import sys
+from functools import cached_property
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
@@ -20,6 +22,7 @@ class Gift(BaseModel):
         occasions: Suitable occasions (optional)
         recipient_types: Target recipients (optional)
         embedding: 1536-dimensional vector from text-embedding-3-small
+            (None for gifts read back from the store without vector data)
         popularity_score: Fallback ranking metric (0.0-1.0)
         purchase_url: URL to purchase the gift (optional)
         has_affiliate_commission: Whether purchase generates affiliate commission
@@ -33,32 +36,38 @@ class Gift(BaseModel):
     categories: list[str] = Field(..., min_length=1)
     occasions: list[str] = Field(default_factory=list)
     recipient_types: list[str] = Field(default_factory=list)
-    embedding: list[float] = Field(..., min_length=1536, max_length=1536)
+    embedding: list[float] | None = Field(default=None, min_length=1536, max_length=1536)
     popularity_score: float = Field(default=0.5, ge=0.0, le=1.0)
     purchase_url: str | None = Field(default=None, max_length=500)
     has_affiliate_commission: bool = Field(default=False)
 
-    @field_validator("categories")
+    @field_validator("categories", "occasions", "recipient_types")
     @classmethod
-    def validate_categories(cls, v: list[str]) -> list[str]:
-        """Ensure at least one category is provided."""
-        if not v:
-            raise ValueError("At least one category is required")
-        return v
+    def intern_tags(cls, v: list[str]) -> list[str]:
+        """Intern tag strings so the catalog shares one object per tag.
 
-    @field_validator("embedding")
-    @classmethod
-    def validate_embedding(cls, v: list[float]) -> list[float]:
-        """Ensure embedding has exactly 1536 dimensions."""
-        if len(v) != 1536:
-            raise ValueError(f"Embedding must have 1536 dimensions, got {len(v)}")
-        return v
+        Tags are low-cardinality ("birthday", "writers", ...); interning
+        deduplicates the string storage across gifts.
+        """
+        return [sys.intern(tag) for tag in v]
+
+    @cached_property
+    def id_str(self) -> str:
+        """String form of the gift ID (computed once).
+
+        UUID formatting allocates a fresh 36-char string on every call;
+        response building and vector-store keys both need it, so the
+        frozen model caches it on first access.
+        """
+        return str(self.id)
 
-    def get_embedding_text(self) -> str:
-        """Get concatenated text used for embedding generation.
+    @cached_property
+    def embedding_text(self) -> str:
+        """Concatenated text used for embedding generation (computed once).
 
         Includes all searchable fields so vector similarity works well
-        with keyword-based queries.
+        with keyword-based queries. The model is frozen, so the result
+        is cached on first access.
         """
         parts = [
             self.name,
@@ -6,21 +6,20 @@ from enum import Enum
 class PriceRange(str, Enum):
     """Price bracket for gift items.
 
-    Values are string-based for JSON serialization compatibility.
+    Values are string-based for JSON serialization compatibility. Each
+    member carries its human-readable range as a plain attribute, so
+    display lookups are a C-level attribute read.
     """
 
-    BUDGET = "budget"  # Under $25
-    MODERATE = "moderate"  # $25 - $75
-    PREMIUM = "premium"  # $75 - $200
-    LUXURY = "luxury"  # Over $200
+    BUDGET = ("budget", "Under $25")
+    MODERATE = ("moderate", "$25 - $75")
+    PREMIUM = ("premium", "$75 - $200")
+    LUXURY = ("luxury", "Over $200")
 
-    @property
-    def display_range(self) -> str:
-        """Get human-readable price range."""
-        ranges = {
-            PriceRange.BUDGET: "Under $25",
-            PriceRange.MODERATE: "$25 - $75",
-            PriceRange.PREMIUM: "$75 - $200",
-            PriceRange.LUXURY: "Over $200",
-        }
-        return ranges[self]
+    display_range: str
+
+    def __new__(cls, value: str, display_range: str) -> "PriceRange":
+        obj = str.__new__(cls, value)
+        obj._value_ = value
+        obj.display_range = display_range
+        return obj
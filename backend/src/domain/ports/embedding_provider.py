@@ -1,5 +1,6 @@
 """Port interface for embedding generation operations."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -35,6 +36,21 @@ class EmbeddingProviderPort(ABC):
         """
         ...
 
+    def embed_text_async(self, text: str) -> "asyncio.Task[list[float]]":
+        """Schedule embedding generation without waiting for the result.
+
+        Returns an already-running task so callers can kick off the API
+        round trip early (e.g. while a request is still being validated)
+        and await the result just before it is needed.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            A scheduled task resolving to the embedding vector
+        """
+        return asyncio.create_task(self.embed_text(text))
+
     @abstractmethod
     def get_dimensions(self) -> int:
         """Get the dimensionality of embeddings produced by this provider.
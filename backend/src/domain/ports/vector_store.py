@@ -86,6 +86,18 @@ class VectorStorePort(ABC):
         """
         ...
 
+    async def upsert_many(self, gifts: list[Gift]) -> None:
+        """Insert or update multiple gifts in the vector store.
+
+        Default implementation upserts one gift at a time; implementations
+        backed by a batch API should override this.
+
+        Args:
+            gifts: Gift entities with embeddings to store
+        """
+        for gift in gifts:
+            await self.upsert(gift)
+
     @abstractmethod
     async def find_by_name(self, name: str) -> Gift | None:
         """Find a gift by its exact name.
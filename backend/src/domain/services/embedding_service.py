@@ -1,5 +1,7 @@
 """Embedding service for text vectorization."""
 
+import numpy as np
+
 from src.domain.ports.embedding_provider import EmbeddingProviderPort
 
 
@@ -53,17 +55,15 @@ class EmbeddingService:
         if len(embeddings) == 1:
             return embeddings[0]
 
-        if weights is None:
-            weights = [1.0 / len(embeddings)] * len(embeddings)
-
-        dimension = len(embeddings[0])
-        blended = [0.0] * dimension
+        # Packed float32 keeps the math in C instead of boxed Python floats
+        matrix = np.asarray(embeddings, dtype=np.float32)
 
-        for embedding, weight in zip(embeddings, weights):
-            for i in range(dimension):
-                blended[i] += embedding[i] * weight
+        if weights is None:
+            blended = matrix.mean(axis=0)
+        else:
+            blended = np.asarray(weights, dtype=np.float32) @ matrix
 
-        return blended
+        return blended.tolist()
 
     def subtract_embedding(
         self,
@@ -84,10 +84,12 @@ class EmbeddingService:
         Returns:
             An adjusted embedding vector.
         """
-        dimension = len(positive)
-        result = [0.0] * dimension
+        if negative_weight == 0.0:
+            return positive
+
+        positive_vector = np.asarray(positive, dtype=np.float32)
+        negative_vector = np.asarray(negative, dtype=np.float32)
 
-        for i in range(dimension):
-            result[i] = positive[i] - (negative[i] * negative_weight)
+        result = positive_vector - (negative_vector * np.float32(negative_weight))
 
-        return result
+        return result.tolist()
@@ -1,5 +1,9 @@
 """Recommendation service for gift suggestions."""
 
+import asyncio
+
+import structlog
+
 from src.domain.entities.gift import Gift
 from src.domain.entities.query_context import QueryContext
 from src.domain.entities.recommendation_request import RecommendationRequest
@@ -11,6 +15,22 @@ from src.domain.ports.embedding_provider import EmbeddingProviderPort
 from src.domain.ports.vector_store import VectorStorePort
 from src.domain.services.embedding_service import EmbeddingService
 
+logger = structlog.get_logger()
+
+
+def _consume_popular_error(task: asyncio.Task) -> None:
+    """Retrieve the speculative task's exception if it failed unused.
+
+    A fast get_popular failure would otherwise sit unretrieved and emit
+    a task-exception-was-never-retrieved warning at GC on top of the
+    real error.
+    """
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.debug("popular_fallback_failed", error=str(exc))
+
 
 class RecommendationService:
     """Service for generating gift recommendations."""
@@ -30,6 +50,20 @@ class RecommendationService:
         self._vector_store = vector_store
         self._embedding_service = EmbeddingService(provider=embedding_provider)
 
+    async def embed_query(self, keywords: str) -> list[float]:
+        """Embed search keywords as a query vector.
+
+        Exposed for callers (e.g. semantic caching) that need the query
+        embedding before or instead of running a full recommendation search.
+
+        Args:
+            keywords: The search keywords to embed.
+
+        Returns:
+            A 1536-dimensional embedding vector.
+        """
+        return await self._embedding_provider.embed_text(keywords)
+
     async def get_recommendations(
         self,
         request: RecommendationRequest,
@@ -42,58 +76,73 @@ class RecommendationService:
         Returns:
             A response containing gift recommendations and query context.
         """
-        # Embed the search keywords
-        query_embedding = await self._embedding_provider.embed_text(request.keywords)
-
-        # Apply negative keywords if provided
-        if request.negative_keywords:
-            negative_embedding = await self._embedding_provider.embed_text(
-                request.negative_keywords
-            )
-            query_embedding = self._embedding_service.subtract_embedding(
-                positive=query_embedding,
-                negative=negative_embedding,
-                negative_weight=0.3,
-            )
-
-        # Search for similar gifts
         limit = request.limit or 5
 
-        search_results = await self._vector_store.search_similar(
-            embedding=query_embedding,
-            limit=limit * 2,  # Get extra to account for low scores
-            threshold=0.3,  # Lower threshold for keyword search
-        )
-
-        # Track query context
-        total_searched = await self._vector_store.get_total_count()
-        fallback_used = False
-
-        # If no results above threshold, fall back to popular gifts
-        if not search_results:
-            fallback_used = True
-            search_results = await self._vector_store.get_popular(limit=limit)
-
-        # Convert results to recommendations
+        # The popularity fallback is speculative: start it now so its
+        # latency hides behind the embed + search pipeline, and cancel it
+        # if the similarity search produces results.
+        popular_task = asyncio.create_task(self._vector_store.get_popular(limit=limit))
+        popular_task.add_done_callback(_consume_popular_error)
+
+        try:
+            # Embed the keywords; with negative keywords present, both texts
+            # go out in one batched API call instead of two round trips
+            if request.negative_keywords:
+                query_embedding, negative_embedding = (
+                    await self._embedding_provider.embed_texts(
+                        [request.keywords, request.negative_keywords]
+                    )
+                )
+                query_embedding = self._embedding_service.subtract_embedding(
+                    positive=query_embedding,
+                    negative=negative_embedding,
+                    negative_weight=0.3,
+                )
+            else:
+                query_embedding = await self._embedding_provider.embed_text(
+                    request.keywords
+                )
+
+            # Search for similar gifts; the catalog count only feeds the
+            # query context, so it runs concurrently with the search
+            search_results, total_searched = await asyncio.gather(
+                self._vector_store.search_similar(
+                    embedding=query_embedding,
+                    limit=limit * 2,  # Get extra to account for low scores
+                    threshold=0.3,  # Lower threshold for keyword search
+                ),
+                self._vector_store.get_total_count(),
+            )
+            fallback_used = False
+
+            # If no results above threshold, fall back to the popular
+            # gifts already in flight
+            if not search_results:
+                fallback_used = True
+                search_results = await popular_task
+        finally:
+            if not popular_task.done():
+                popular_task.cancel()
+
+        # Convert results to recommendations. Both search_similar and
+        # get_popular return results in descending score order (see
+        # VectorStorePort), so no re-sort is needed before the cut.
         gifts = [
             self._gift_to_recommendation(gift, score)
-            for gift, score in search_results
+            for gift, score in search_results[:limit]
         ]
 
-        # Sort by relevance score descending
-        gifts.sort(key=lambda g: g.relevance_score, reverse=True)
-
-        # Respect the limit
-        gifts = gifts[:limit]
-
         query_context = QueryContext(
             total_searched=total_searched,
-            above_threshold=len([g for g in gifts if g.relevance_score >= 0.3]),
+            above_threshold=sum(1 for g in gifts if g.relevance_score >= 0.3),
             starred_boost_applied=False,
             fallback_used=fallback_used,
         )
 
-        return RecommendationResponse(
+        # Both fields were just built from validated models, so skip the
+        # redundant re-validation pass over every gift. model_construct
+        # bypasses validators; keep the inputs trusted.
+        return RecommendationResponse.model_construct(
             gifts=gifts,
             query_context=query_context,
         )
@@ -113,7 +162,7 @@ class RecommendationService:
             A GiftRecommendation with the gift data.
         """
         return GiftRecommendation(
-            id=str(gift.id),
+            id=gift.id_str,
             name=gift.name,
             brief_description=gift.brief_description,
             relevance_score=score,
@@ -25,13 +25,23 @@ def main() -> None:
     log.info("starting_server")
 
     # Create adapters
-    embedding_adapter = OpenAIEmbeddingAdapter(api_key=settings.openai_api_key)
+    embedding_adapter = OpenAIEmbeddingAdapter(
+        api_key=settings.openai_api_key,
+        cache_capacity=settings.embedding_cache_capacity,
+        cache_ttl_seconds=settings.embedding_cache_ttl,
+        cache_path=settings.embedding_cache_path,
+        fuzzy_cache=settings.embedding_fuzzy_cache,
+        batch_window_ms=settings.embedding_batch_window_ms,
+        batch_max=settings.embedding_batch_max,
+    )
     vector_adapter = S3VectorsAdapter(
         bucket=settings.s3_vectors_bucket,
         index_name=settings.s3_vectors_index,
         region=settings.aws_region,
         aws_access_key_id=settings.aws_access_key_id,
         aws_secret_access_key=settings.aws_secret_access_key,
+        max_pool_connections=settings.s3_vectors_max_pool,
+        overfetch_factor=settings.search_overfetch_factor,
     )
 
     # Create domain services
@@ -50,6 +60,17 @@ def main() -> None:
 
     log.info("server_configured", adapters=["openai_embedding", "s3_vectors"])
 
+    # The serving path is almost entirely awaiting network I/O (embed API,
+    # vector store), so run on the libuv event loop when the optional
+    # uvloop extra is installed; fall back to the default loop otherwise.
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
+        log.info("uvloop_installed")
+
     # Check transport mode from settings
     if settings.mcp_transport == "stdio":
         log.info("starting_stdio_server")
@@ -12,13 +12,13 @@ from src.domain.ports.embedding_provider import EmbeddingProviderPort
 from src.domain.ports.vector_store import VectorStorePort
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_embedding() -> list[float]:
-    """Generate a sample 1536-dimensional embedding."""
+    """Generate a sample 1536-dimensional embedding (shared per module)."""
     return [0.1] * 1536
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_gift(sample_embedding: list[float]) -> Gift:
     """Create a sample gift for testing."""
     return Gift(
@@ -35,9 +35,14 @@ def sample_gift(sample_embedding: list[float]) -> Gift:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_gifts(sample_embedding: list[float]) -> list[Gift]:
-    """Create multiple sample gifts for testing."""
+    """Create multiple sample gifts for testing.
+
+    Module-scoped: Gift is frozen and the tests only read these, so one
+    set of entities (and their 1536-float embeddings) serves the whole
+    module instead of being rebuilt per test.
+    """
     return [
         Gift(
             id=uuid4(),
@@ -77,7 +82,9 @@ def mock_embedding_provider() -> EmbeddingProviderPort:
     """Create a mock embedding provider."""
     mock = MagicMock(spec=EmbeddingProviderPort)
     mock.embed_text = AsyncMock(return_value=[0.1] * 1536)
-    mock.embed_texts = AsyncMock(return_value=[[0.1] * 1536])
+    mock.embed_texts = AsyncMock(
+        side_effect=lambda texts: [[0.1] * 1536 for _ in texts]
+    )
     mock.get_dimensions.return_value = 1536
     mock.health_check = AsyncMock(return_value={"status": "healthy"})
     return mock
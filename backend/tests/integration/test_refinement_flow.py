@@ -33,8 +33,10 @@ class TestNegativeKeywordsFlow:
 
         response = await service.get_recommendations(request)
 
-        # Embedding provider should be called twice: keywords and negative
-        assert mock_embedding_provider.embed_text.call_count == 2
+        # Keywords and negative keywords go out in one batched call
+        mock_embedding_provider.embed_texts.assert_called_once_with(
+            ["coffee lover morning", "espresso machine maker"]
+        )
         assert response is not None
 
     @pytest.mark.asyncio
@@ -0,0 +1,72 @@
+"""Unit tests for the embedding micro-batcher."""
+
+import asyncio
+
+import pytest
+
+from src.adapters.embeddings.batcher import EmbeddingBatcher
+
+
+class TestEmbeddingBatcher:
+    """Unit tests for EmbeddingBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submits_coalesce_into_one_call(self) -> None:
+        """Test that submits within the window share one batch call."""
+        calls: list[list[str]] = []
+
+        async def embed_batch(texts: list[str]) -> list[list[float]]:
+            calls.append(texts)
+            return [[float(i)] * 1536 for i in range(len(texts))]
+
+        batcher = EmbeddingBatcher(embed_batch=embed_batch, window_ms=20.0)
+
+        results = await asyncio.gather(
+            batcher.submit("first"),
+            batcher.submit("second"),
+            batcher.submit("third"),
+        )
+
+        assert len(calls) == 1
+        assert calls[0] == ["first", "second", "third"]
+        assert results[0][0] == 0.0
+        assert results[2][0] == 2.0
+
+    @pytest.mark.asyncio
+    async def test_max_batch_flushes_immediately(self) -> None:
+        """Test that hitting max_batch flushes without waiting the window."""
+        calls: list[list[str]] = []
+
+        async def embed_batch(texts: list[str]) -> list[list[float]]:
+            calls.append(texts)
+            return [[0.1] * 1536 for _ in texts]
+
+        batcher = EmbeddingBatcher(
+            embed_batch=embed_batch,
+            window_ms=10_000.0,  # Would time out the test if waited on
+            max_batch=2,
+        )
+
+        await asyncio.wait_for(
+            asyncio.gather(batcher.submit("first"), batcher.submit("second")),
+            timeout=1.0,
+        )
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_propagates_to_all_callers(self) -> None:
+        """Test that an API error rejects every pending future."""
+
+        async def embed_batch(texts: list[str]) -> list[list[float]]:
+            raise RuntimeError("API down")
+
+        batcher = EmbeddingBatcher(embed_batch=embed_batch, window_ms=1.0)
+
+        results = await asyncio.gather(
+            batcher.submit("first"),
+            batcher.submit("second"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
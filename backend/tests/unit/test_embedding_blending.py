@@ -1,20 +1,27 @@
 """Unit tests for embedding operations in EmbeddingService."""
 
+from unittest.mock import MagicMock
+
 import pytest
 
 from src.domain.services.embedding_service import EmbeddingService
 
 
+@pytest.fixture(scope="module")
+def service() -> EmbeddingService:
+    """Create one EmbeddingService shared by every test in this module.
+
+    The blending and subtraction tests never touch the provider, so a
+    single instance with a bare mock is enough.
+    """
+    return EmbeddingService(provider=MagicMock())
+
+
 class TestEmbeddingSubtraction:
     """Tests for negative embedding subtraction."""
 
-    def test_subtract_embedding_basic(self) -> None:
+    def test_subtract_embedding_basic(self, service: EmbeddingService) -> None:
         """Test basic embedding subtraction."""
-        from unittest.mock import MagicMock
-
-        provider = MagicMock()
-        service = EmbeddingService(provider=provider)
-
         positive = [1.0, 0.5, 0.0]
         negative = [0.5, 0.5, 0.5]
 
@@ -27,13 +34,8 @@ class TestEmbeddingSubtraction:
         assert result[1] == pytest.approx(0.25)
         assert result[2] == pytest.approx(-0.25)
 
-    def test_subtract_embedding_default_weight(self) -> None:
+    def test_subtract_embedding_default_weight(self, service: EmbeddingService) -> None:
         """Test embedding subtraction with default weight (0.3)."""
-        from unittest.mock import MagicMock
-
-        provider = MagicMock()
-        service = EmbeddingService(provider=provider)
-
         positive = [1.0] * 3
         negative = [1.0] * 3
 
@@ -42,13 +44,8 @@ class TestEmbeddingSubtraction:
         # 1.0 - 0.3*1.0 = 0.7
         assert all(v == pytest.approx(0.7) for v in result)
 
-    def test_subtract_embedding_zero_weight(self) -> None:
+    def test_subtract_embedding_zero_weight(self, service: EmbeddingService) -> None:
         """Test that zero weight returns original embedding."""
-        from unittest.mock import MagicMock
-
-        provider = MagicMock()
-        service = EmbeddingService(provider=provider)
-
         positive = [0.5, 0.3, 0.8]
         negative = [1.0, 1.0, 1.0]
 
@@ -58,13 +55,10 @@ class TestEmbeddingSubtraction:
         assert result[1] == pytest.approx(0.3)
         assert result[2] == pytest.approx(0.8)
 
-    def test_subtract_embedding_preserves_dimensions(self) -> None:
+    def test_subtract_embedding_preserves_dimensions(
+        self, service: EmbeddingService
+    ) -> None:
         """Test that subtraction preserves embedding dimensions."""
-        from unittest.mock import MagicMock
-
-        provider = MagicMock()
-        service = EmbeddingService(provider=provider)
-
         positive = [0.1] * 1536
         negative = [0.2] * 1536
 
@@ -76,25 +70,17 @@ class TestEmbeddingSubtraction:
 class TestEmbeddingBlending:
     """Tests for embedding blending."""
 
-    def test_blend_single_embedding_returns_same(self) -> None:
+    def test_blend_single_embedding_returns_same(
+        self, service: EmbeddingService
+    ) -> None:
         """Test that blending a single embedding returns it unchanged."""
-        from unittest.mock import MagicMock
-
-        provider = MagicMock()
-        service = EmbeddingService(provider=provider)
-
         embedding = [0.5, 0.3, 0.8]
         result = service.blend_embeddings([embedding])
 
         assert result == embedding
 
-    def test_blend_equal_weights(self) -> None:
+    def test_blend_equal_weights(self, service: EmbeddingService) -> None:
         """Test blending with equal weights."""
-        from unittest.mock import MagicMock
-
-        provider = MagicMock()
-        service = EmbeddingService(provider=provider)
-
         emb1 = [1.0, 0.0]
         emb2 = [0.0, 1.0]
 
@@ -104,13 +90,8 @@ class TestEmbeddingBlending:
         assert result[0] == pytest.approx(0.5)
         assert result[1] == pytest.approx(0.5)
 
-    def test_blend_custom_weights(self) -> None:
+    def test_blend_custom_weights(self, service: EmbeddingService) -> None:
         """Test blending with custom weights."""
-        from unittest.mock import MagicMock
-
-        provider = MagicMock()
-        service = EmbeddingService(provider=provider)
-
         emb1 = [1.0, 0.0]
         emb2 = [0.0, 1.0]
 
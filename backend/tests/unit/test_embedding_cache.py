@@ -0,0 +1,96 @@
+"""Unit tests for the embedding cache and cached OpenAI adapter paths."""
+
+from pathlib import Path
+
+from src.adapters.embeddings.cache import EmbeddingCache
+
+
+class TestEmbeddingCache:
+    """Unit tests for EmbeddingCache."""
+
+    async def test_get_returns_none_on_miss(self) -> None:
+        """Test that an unknown text misses the cache."""
+        cache = EmbeddingCache(model="test-model")
+
+        assert await cache.get("never seen") is None
+
+    async def test_put_then_get_returns_embedding(self) -> None:
+        """Test that a stored embedding is returned on lookup."""
+        cache = EmbeddingCache(model="test-model")
+        embedding = [0.1] * 1536
+
+        await cache.put("coffee lover birthday", embedding)
+
+        assert await cache.get("coffee lover birthday") == embedding
+
+    async def test_keys_are_model_scoped(self, tmp_path: Path) -> None:
+        """Test that the same text under a different model misses.
+
+        Both caches share one SQLite file, so the miss can only come from
+        the model being part of the key.
+        """
+        db_path = str(tmp_path / "embeddings.db")
+        cache_a = EmbeddingCache(model="model-a", db_path=db_path)
+        cache_b = EmbeddingCache(model="model-b", db_path=db_path)
+
+        await cache_a.put("same text", [0.1] * 1536)
+
+        assert await cache_b.get("same text") is None
+        assert await cache_a.get("same text") is not None
+
+    async def test_lru_evicts_oldest_entry_at_capacity(self) -> None:
+        """Test that exceeding capacity evicts the least recently used entry."""
+        cache = EmbeddingCache(model="test-model", capacity=2)
+
+        await cache.put("first", [0.1] * 1536)
+        await cache.put("second", [0.2] * 1536)
+        await cache.put("third", [0.3] * 1536)
+
+        assert await cache.get("first") is None
+        assert await cache.get("second") is not None
+        assert await cache.get("third") is not None
+
+    async def test_expired_entry_misses(self) -> None:
+        """Test that entries past their TTL are treated as misses."""
+        cache = EmbeddingCache(model="test-model", ttl_seconds=-1.0)
+
+        await cache.put("stale", [0.1] * 1536)
+
+        assert await cache.get("stale") is None
+
+    async def test_sqlite_store_survives_new_cache_instance(self, tmp_path: Path) -> None:
+        """Test that the SQLite backing store persists across instances."""
+        db_path = str(tmp_path / "embeddings.db")
+        embedding = [0.5] * 1536
+
+        first = EmbeddingCache(model="test-model", db_path=db_path)
+        await first.put("persisted text", embedding)
+
+        second = EmbeddingCache(model="test-model", db_path=db_path)
+
+        assert await second.get("persisted text") == embedding
+
+    async def test_fuzzy_lookup_matches_near_duplicate(self) -> None:
+        """Test that a trivial edit of a recent text hits the fuzzy path."""
+        cache = EmbeddingCache(model="test-model", fuzzy=True)
+        embedding = [0.1] * 1536
+
+        await cache.put("coffee lover birthday gift ideas", embedding)
+
+        assert cache.get_fuzzy("coffee lover birthday gift ideas ") == embedding
+
+    async def test_fuzzy_lookup_rejects_different_text(self) -> None:
+        """Test that a genuinely different text misses the fuzzy path."""
+        cache = EmbeddingCache(model="test-model", fuzzy=True)
+
+        await cache.put("coffee lover birthday gift ideas", [0.1] * 1536)
+
+        assert cache.get_fuzzy("outdoor camping gear for dad") is None
+
+    async def test_fuzzy_lookup_disabled_by_default(self) -> None:
+        """Test that fuzzy lookups are off unless enabled."""
+        cache = EmbeddingCache(model="test-model")
+
+        await cache.put("coffee lover birthday gift ideas", [0.1] * 1536)
+
+        assert cache.get_fuzzy("coffee lover birthday gift ideas ") is None
@@ -97,3 +97,19 @@ class TestEmbeddingService:
         # Weighted average: 1.0 * 0.75 + 0.0 * 0.25 = 0.75
         assert len(blended) == 1536
         assert abs(blended[0] - 0.75) < 0.001
+
+
+class TestEmbedTextAsync:
+    """Unit tests for the embed_text_async prefetch hook."""
+
+    @pytest.mark.asyncio
+    async def test_embed_text_async_returns_scheduled_task(self) -> None:
+        """Test that embed_text_async returns an awaitable task with the embedding."""
+        from src.dev_server import MockEmbeddingProvider
+
+        provider = MockEmbeddingProvider()
+
+        task = provider.embed_text_async("Test text")
+
+        embedding = await task
+        assert len(embedding) == 1536
@@ -167,3 +167,116 @@ class TestGetGiftDetailsTool:
         assert details["purchase_url"] is None
         # has_affiliate_commission is internal only, not exposed in MCP response
         assert "has_affiliate_commission" not in details
+
+
+class TestGiftDetailsCache:
+    """Tests for the prefetched details cache path."""
+
+    @pytest.fixture
+    def sample_gift(self) -> Gift:
+        """Create a sample gift for cache tests."""
+        return Gift(
+            id=TEST_UUID,
+            name="Leather Journal",
+            brief_description="Hand-crafted leather journal",
+            full_description="A beautiful hand-crafted leather journal.",
+            price_range=PriceRange.MODERATE,
+            categories=["stationery"],
+            embedding=[0.1] * 1536,
+        )
+
+    @pytest.mark.asyncio
+    async def test_cached_gift_skips_vector_store(
+        self,
+        mock_vector_store: VectorStorePort,
+        sample_gift: Gift,
+    ) -> None:
+        """A prefetched gift should be served without a vector store call."""
+        from src.adapters.mcp.details_cache import GiftDetailsCache
+        from src.adapters.mcp.tools.get_gift_details import get_gift_details_handler
+
+        cache = GiftDetailsCache()
+        cache.put(str(TEST_UUID), sample_gift)
+        mock_vector_store.get_by_id = AsyncMock(return_value=None)
+
+        result = await get_gift_details_handler(
+            gift_id=str(TEST_UUID),
+            vector_store=mock_vector_store,
+            details_cache=cache,
+        )
+
+        assert result["structuredContent"]["name"] == "Leather Journal"
+        mock_vector_store.get_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_populates_cache(
+        self,
+        mock_vector_store: VectorStorePort,
+        sample_gift: Gift,
+    ) -> None:
+        """A miss should fetch from the store and fill the cache."""
+        from src.adapters.mcp.details_cache import GiftDetailsCache
+        from src.adapters.mcp.tools.get_gift_details import get_gift_details_handler
+
+        cache = GiftDetailsCache()
+        mock_vector_store.get_by_id = AsyncMock(return_value=sample_gift)
+
+        await get_gift_details_handler(
+            gift_id=str(TEST_UUID),
+            vector_store=mock_vector_store,
+            details_cache=cache,
+        )
+
+        assert cache.get(str(TEST_UUID)) is sample_gift
+
+    def test_expired_entry_misses(self, sample_gift: Gift) -> None:
+        """Entries past their TTL should be treated as misses."""
+        from src.adapters.mcp.details_cache import GiftDetailsCache
+
+        cache = GiftDetailsCache(ttl_seconds=-1.0)
+        cache.put(str(TEST_UUID), sample_gift)
+
+        assert cache.get(str(TEST_UUID)) is None
+
+
+class TestFormatCache:
+    """Tests for the memoized human-readable formatter."""
+
+    def test_repeated_format_returns_same_text(self) -> None:
+        """Formatting the same details twice should return identical text."""
+        from src.adapters.mcp.tools.get_gift_details import _format_human_readable
+        from src.domain.entities.gift_details import GiftDetails
+
+        details = GiftDetails(
+            id=str(TEST_UUID),
+            name="Leather Journal",
+            brief_description="Hand-crafted leather journal",
+            full_description="A beautiful hand-crafted leather journal.",
+            price_range=PriceRange.MODERATE,
+            categories=["stationery"],
+        )
+
+        first = _format_human_readable(details)
+        second = _format_human_readable(details)
+
+        assert first is second
+
+    def test_changed_details_re_render(self) -> None:
+        """Updated details under the same ID should produce fresh text."""
+        from src.adapters.mcp.tools.get_gift_details import _format_human_readable
+        from src.domain.entities.gift_details import GiftDetails
+
+        base = {
+            "id": str(TEST_UUID),
+            "brief_description": "Hand-crafted leather journal",
+            "full_description": "A beautiful hand-crafted leather journal.",
+            "price_range": PriceRange.MODERATE,
+            "categories": ["stationery"],
+        }
+        original = GiftDetails(name="Leather Journal", **base)
+        updated = GiftDetails(name="Embossed Leather Journal", **base)
+
+        _format_human_readable(original)
+        text = _format_human_readable(updated)
+
+        assert "Embossed Leather Journal" in text
@@ -140,14 +140,22 @@ class TestRecommendationServiceGetRecommendations:
         mock_vector_store.get_popular.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_negative_keywords_creates_two_embeddings(
+    async def test_negative_keywords_batches_embeddings(
         self,
         mock_embedding_provider: EmbeddingProviderPort,
         mock_vector_store: VectorStorePort,
     ) -> None:
-        """Test that negative keywords result in two embedding calls."""
+        """Test that negative keywords use one batched embedding call."""
         from src.domain.services.recommendation_service import RecommendationService
 
+        # The shared fixture sets a side_effect, which outranks
+        # return_value, so override it to hand back distinct vectors
+        mock_embedding_provider.embed_texts.side_effect = None
+        mock_embedding_provider.embed_texts.return_value = [
+            [0.1] * 1536,
+            [0.2] * 1536,
+        ]
+
         service = RecommendationService(
             embedding_provider=mock_embedding_provider,
             vector_store=mock_vector_store,
@@ -160,5 +168,8 @@ class TestRecommendationServiceGetRecommendations:
 
         await service.get_recommendations(request)
 
-        # Should embed both keywords and negative keywords
-        assert mock_embedding_provider.embed_text.call_count == 2
+        # Both texts go out in a single embed_texts call
+        mock_embedding_provider.embed_texts.assert_called_once_with(
+            ["coffee lover", "espresso machine"]
+        )
+        mock_embedding_provider.embed_text.assert_not_called()
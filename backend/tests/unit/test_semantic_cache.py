@@ -0,0 +1,67 @@
+"""Unit tests for SemanticResponseCache."""
+
+from src.adapters.mcp.semantic_cache import SemanticResponseCache
+
+
+def _embedding(direction: float) -> list[float]:
+    """Build a simple embedding pointing along one axis."""
+    vector = [0.0] * 1536
+    vector[0] = direction
+    return vector
+
+
+class TestSemanticResponseCache:
+    """Unit tests for SemanticResponseCache."""
+
+    def test_lookup_on_empty_cache_misses(self) -> None:
+        """Test that an empty cache always misses."""
+        cache = SemanticResponseCache(namespace="test")
+
+        assert cache.lookup(_embedding(1.0)) is None
+
+    def test_identical_query_hits(self) -> None:
+        """Test that the same embedding returns the stored response."""
+        cache = SemanticResponseCache(namespace="test")
+        response = {"structuredContent": {"gifts": []}, "content": "cached"}
+
+        cache.store(_embedding(1.0), response)
+
+        assert cache.lookup(_embedding(1.0)) == response
+
+    def test_dissimilar_query_misses(self) -> None:
+        """Test that an orthogonal embedding misses the cache."""
+        cache = SemanticResponseCache(namespace="test")
+        orthogonal = [0.0] * 1536
+        orthogonal[1] = 1.0
+
+        cache.store(_embedding(1.0), {"content": "cached"})
+
+        assert cache.lookup(orthogonal) is None
+
+    def test_mismatched_options_miss(self) -> None:
+        """Test that a similar query with different options misses."""
+        cache = SemanticResponseCache(namespace="test")
+
+        cache.store(_embedding(1.0), {"content": "cached"}, options=("neg", 5))
+
+        assert cache.lookup(_embedding(1.0), options=("neg", 10)) is None
+
+    def test_expired_entry_misses(self) -> None:
+        """Test that entries past their TTL are evicted on lookup."""
+        cache = SemanticResponseCache(namespace="test", ttl_seconds=-1.0)
+
+        cache.store(_embedding(1.0), {"content": "cached"})
+
+        assert cache.lookup(_embedding(1.0)) is None
+
+    def test_capacity_evicts_oldest_entry(self) -> None:
+        """Test that exceeding capacity drops the oldest entry."""
+        cache = SemanticResponseCache(namespace="test", capacity=1)
+        orthogonal = [0.0] * 1536
+        orthogonal[1] = 1.0
+
+        cache.store(_embedding(1.0), {"content": "first"})
+        cache.store(orthogonal, {"content": "second"})
+
+        assert cache.lookup(_embedding(1.0)) is None
+        assert cache.lookup(orthogonal) == {"content": "second"}